@@ -7,13 +7,17 @@ from __future__ import print_function
 
 import numpy as np
 import warnings
+from collections import namedtuple
 
 import treelib as tlib
 
 from tunacell.base.observable import Observable, FunctionalObservable
 from tunacell.base.datatools import (Coordinates, compute_rates,
                                  extrapolate_endpoints,
-                                 derivative, logderivative, ExtrapolationError)
+                                 extrapolate_birth_division,
+                                 _derivative, _slope,
+                                 segment_nanmeans, segment_slopes, nanminmax,
+                                 ExtrapolationError)
 
 
 class CellError(Exception):
@@ -32,6 +36,44 @@ class CellDivisionError(CellError):
     pass
 
 
+#: Frozen copy of the Observable parameters read when building cell data
+ObsSpec = namedtuple('ObsSpec', ['label', 'raw', 'mode', 'scale', 'local_fit',
+                                 'differentiate', 'time_window',
+                                 'join_points', 'timelapse'])
+
+
+def _specialize(obs):
+    """Returns the :class:`ObsSpec` of an Observable
+
+    Observable attributes (and the label string) are computed once, so
+    that the same specification is passed to every cell build instead of
+    reading the Observable attributes in each cell.
+
+    Parameters
+    ----------
+    obs : :class:`Observable` or :class:`ObsSpec` instance
+        an ObsSpec instance is returned unchanged
+
+    Returns
+    -------
+    :class:`ObsSpec` instance
+        its `timelapse` field stores the specification of the timelapse
+        counterpart for cell-cycle observables (None for 'dynamics' mode)
+    """
+    if isinstance(obs, ObsSpec):
+        return obs
+    spec = ObsSpec(label=str(obs.label), raw=obs.raw, mode=obs.mode,
+                   scale=obs.scale, local_fit=obs.local_fit,
+                   differentiate=obs.differentiate,
+                   time_window=obs.time_window, join_points=obs.join_points,
+                   timelapse=None)
+    if obs.mode != 'dynamics':
+        tlabel = str(obs.as_timelapse().label)
+        spec = spec._replace(timelapse=spec._replace(label=tlabel,
+                                                     mode='dynamics'))
+    return spec
+
+
 class Cell(tlib.Node):
     """General class to handle cell data structure.
 
@@ -79,12 +121,52 @@ class Cell(tlib.Node):
         self._birth_time = None
         self._division_time = None
         self._sdata = {}  # dictionary to contain computed data
-        self._protected_against_build = set()  # set of obs not to re-build
+        self._protected_against_build = set()  # keys of obs not to re-build
+        self._built_labels = set()  # labels of data computed for this cell
         self.container = container  # point to Container instance
         # cells are built from a specific container instance
         # container can be a given field of view, a channel, a microcolony, ...
         return
 
+    @property
+    def data(self):
+        "Get structured array of raw data."
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        "Set raw data, prepare views on its fields, forget values built before."
+        self._data = value
+        self._prepare_views()
+        # values built from previous data are stale: they will be rebuilt
+        self._sdata = {}
+        self._built_labels = set()
+
+    def _prepare_views(self):
+        """Maps field names of the data structured array to views
+
+        `_fields` maps each field name to a view of the field (no copy, so
+        that in place modifications of data are seen), `_time` is the 'time'
+        field (None when data is missing). Log values of fields are cached in
+        `_log_fields` when requested, see :meth:`_log_field`.
+        """
+        self._log_fields = {}
+        self._fields = {}
+        names = getattr(getattr(self._data, 'dtype', None), 'names', None)
+        if names:
+            self._fields = {name: self._data[name] for name in names}
+        self._time = self._fields.get('time')
+        return
+
+    def _log_field(self, raw):
+        "Get log values of raw field, computed once per cell."
+        try:
+            return self._log_fields[raw]
+        except KeyError:
+            values = np.log(self._fields[raw])
+            self._log_fields[raw] = values
+            return values
+
     # We add few definitions to be able to chain between Cell instances
     @property
     def childs(self):
@@ -95,11 +177,13 @@ class Cell(tlib.Node):
     def childs(self, value):
         if value is None:
             self._childs = []
-        elif isinstance(value, list):
-            for item in value:
-                self.childs = item
         elif isinstance(value, Cell):
             self._childs.append(value)
+        elif isinstance(value, list):
+            for item in value:
+                if not isinstance(item, Cell):
+                    raise CellChildsError
+            self._childs.extend(value)
         else:
             raise CellChildsError
 
@@ -144,11 +228,11 @@ class Cell(tlib.Node):
         "method to call when parent is identified"
         previous_frame = None
         if (self.parent is not None) and (self.parent.data is not None):
-            previous_frame = self.parent.data['time'][-1]
+            previous_frame = self.parent._time[-1]
 
         first_frame = None
         if self.data is not None:
-            first_frame = self.data['time'][0]
+            first_frame = self._time[0]
 
         if previous_frame is not None and first_frame is not None:
             div_time = (previous_frame + first_frame)/2.  # halfway
@@ -188,27 +272,104 @@ class Cell(tlib.Node):
         return dic
 
     def protect_against_build(self, obs):
-        """Protect current cell against building obs array/value"""
-        self._protected_against_build.add(obs)
+        """Protect current cell against building obs array/value
+
+        Identically defined observables (same `_key`) are protected as well.
+        """
+        self._protected_against_build.add(obs._key)
         return
 
-    def build(self, obs):
-        """Builds timeseries"""
-        if obs in self._protected_against_build:
+    def build(self, obs, spec=None):
+        """Builds timeseries
+
+        Parameters
+        ----------
+        obs : :class:`Observable` or :class:`FunctionalObservable` instance
+        spec : :class:`ObsSpec` instance (default None)
+            specification of obs when it is an Observable instance; pass it
+            when building the same obs over many cells to avoid re-reading
+            obs attributes in each cell
+        """
+        if not isinstance(obs, (Observable, FunctionalObservable)):
+            raise TypeError('obs must be of type Observable or FunctionalObservable')
+        if obs._key in self._protected_against_build:
             return
         if isinstance(obs, FunctionalObservable):
+            label = obs.label
+            if label in self._built_labels:
+                return
             # first build every single Observable
             for item in obs.observables:
                 self.build(item)
             arrays = [self._sdata[item.label] for item in obs.observables]
-            self._sdata[obs.label] = obs.f(*arrays)
+            self._sdata[label] = obs.f(*arrays)
+            self._built_labels.add(label)
         elif isinstance(obs, Observable):
-            if obs.mode == 'dynamics':
-                self.build_timelapse(obs)
+            if spec is None:
+                spec = _specialize(obs)
+            if spec.mode == 'dynamics':
+                self.build_timelapse(spec)
             else:
-                self.compute_cyclized(obs)
-        else:
-            raise TypeError('obs must be of type Observable or FunctionalObservable')
+                self.compute_cyclized(spec)
+
+    @classmethod
+    def build_population(cls, cells, obs):
+        """Builds obs for a list of cells at once.
+
+        Cell-cycle observables in 'average' or 'rate' mode reduce to one
+        value per cell: these values are computed with vectorized operations
+        over the concatenation of all cells' timelapse arrays, instead of
+        one call per cell. Other observables are built cell by cell.
+
+        Parameters
+        ----------
+        cells : list of :class:`Cell` instances
+        obs : :class:`Observable` or :class:`FunctionalObservable` instance
+        """
+        spec = None
+        if isinstance(obs, Observable):
+            spec = _specialize(obs)
+        if spec is None or spec.mode not in ('average', 'rate'):
+            for cell in cells:
+                cell.build(obs, spec=spec)
+            return
+        cells = [cell for cell in cells
+                 if obs._key not in cell._protected_against_build and
+                 spec.label not in cell._built_labels]
+        if not cells:
+            return
+        cspec = spec.timelapse
+        clabel = cspec.label
+        # timelapse values are raw values: use cached log values of raw
+        use_log_field = (spec.mode == 'rate' and spec.scale == 'log' and
+                         not cspec.local_fit and not cspec.differentiate)
+        times = []
+        arrays = []
+        for cell in cells:
+            if clabel not in cell._sdata:
+                cell.build_timelapse(cspec)
+            if len(cell.data) > 0:
+                times.append(cell._time)
+                if use_log_field:
+                    arrays.append(cell._log_field(spec.raw))
+                else:
+                    arrays.append(cell._sdata[clabel])
+            else:
+                times.append(np.array([], dtype=float))
+                arrays.append(np.array([], dtype=float))
+        lengths = np.array([len(time) for time in times], dtype=int)
+        values = np.concatenate(arrays).astype(float)
+        if spec.mode == 'average':
+            results = segment_nanmeans(values, lengths)
+        elif spec.mode == 'rate':
+            if spec.scale == 'log' and not use_log_field:
+                values = np.log(values)
+            results = segment_slopes(np.concatenate(times).astype(float),
+                                     values, lengths)
+        for cell, value in zip(cells, results):
+            cell._sdata[spec.label] = value
+            cell._built_labels.add(spec.label)
+        return
 
     def build_timelapse(self, obs):
         """Builds timeseries corresponding to observable of mode 'dynamics'.
@@ -220,7 +381,7 @@ class Cell(tlib.Node):
 
         Parameters
         ----------
-        obs : Observable instance
+        obs : Observable or ObsSpec instance
             mode must be 'dynamics'
 
         Note
@@ -240,56 +401,69 @@ class Cell(tlib.Node):
         .. warning::
            For some computations, the time interval between consecutive
            acquisitions is needed. If it's defined in the container or the
-           experiment metadata, this parameter will be imported; otherwise if
-           there are at least 2 consecutive values, it will be inferred from
-           data (at the risk of making mistakes if there are too many missing
-           values)
+           experiment metadata, this parameter will be imported; otherwise
+           it is inferred once from the container data (at the risk of making
+           mistakes if there are too many missing values)
         """
-        label = str(obs.label)
-        raw = obs.raw
-        coords = Coordinates(self.data['time'], self.data[raw])
+        spec = _specialize(obs)
+        label = spec.label
+        # already computed for this cell (values may have been completed
+        # since by daughter cells)
+        if label in self._built_labels:
+            return
+        # if empty, store and return empty array of appropriate type
+        if len(self.data) == 0:  # there is no data, but it has some dtype
+            self._sdata[label] = np.array([], dtype=float)
+            self._built_labels.add(label)
+            return Coordinates(np.array([], dtype=float),
+                               np.array([], dtype=float))
+        raw = spec.raw
+        coords = Coordinates(self._time, self._fields[raw])
         if self.parent is not None and len(self.parent.data) > 0:
-            anteriors = Coordinates(self.parent.data['time'],
-                                    self.parent.data[raw])
+            anteriors = Coordinates(self.parent._time,
+                                    self.parent._fields[raw])
         else:
             anteriors = Coordinates(np.array([], dtype=float),
                                     np.array([], dtype=float))
-        # if empty, return empty array of appropriate type
-        if len(self.data) == 0:  # there is no data, but it has some dtype
-            return Coordinates(np.array([], dtype=float),
-                               np.array([], dtype=float))
 
         dt = self.container.period
         if dt is None:
-            # automatically finds dt
-            if len(self.data) > 1:
-                arr = self.data['time']
-                time_increments = arr[1:] - arr[:-1]
-                dt = np.round(np.amin(np.abs(time_increments)), decimals=2)
+            # inferred by container when reading data, else from this cell
+            dt = self.container._inferred_period
+        if dt is None and len(self.data) > 1:
+            dt = np.round(np.amin(np.abs(np.diff(self._time))), decimals=2)
 
         # case : no local fit, use data, or finite differences
-        if not obs.local_fit:
-            if obs.differentiate:
-                if obs.scale == 'linear':
-                    new = derivative(coords)
-                elif obs.scale == 'log':
-                    new = logderivative(coords)
-                        
+        if not spec.local_fit:
+            if spec.differentiate:
+                if spec.scale == 'linear':
+                    new = _derivative(coords.x, coords.y)
+                elif spec.scale == 'log':
+                    new = _derivative(coords.x, self._log_field(raw))
             else:
-                new = coords
-            self._sdata[label] = new.y
+                new = coords.y
+            self._sdata[label] = new
+            self._built_labels.add(label)
 
         # case : local estimates using  compute_rates
         else:
-            r, f, ar, af, xx, yy = compute_rates(coords.x, coords.y,
+            y, anterior_y = coords.y, anteriors.y
+            operated = spec.scale == 'log'
+            if operated:
+                # log values are computed once per cell
+                y = self._log_field(raw)
+                if len(anteriors.x) > 0:
+                    anterior_y = self.parent._log_field(raw)
+            r, f, ar, af, xx, yy = compute_rates(coords.x, y,
                                                  x_break=self.birth_time,
                                                  anterior_x=anteriors.x,
-                                                 anterior_y=anteriors.y,
-                                                 scale=obs.scale,
-                                                 time_window=obs.time_window,
+                                                 anterior_y=anterior_y,
+                                                 scale=spec.scale,
+                                                 time_window=spec.time_window,
                                                  dt=dt,
-                                                 join_points=obs.join_points)
-            if obs.differentiate:
+                                                 join_points=spec.join_points,
+                                                 y_operated=operated)
+            if spec.differentiate:
                 to_cell = r
                 to_parent = ar
                 if len(ar) != len(anteriors.x):
@@ -298,13 +472,15 @@ class Cell(tlib.Node):
                 to_cell = f
                 to_parent = af
             self._sdata[label] = to_cell
+            self._built_labels.add(label)
             if self.parent is not None and (not np.all(np.isnan(to_parent))):
-                if label not in self.parent._sdata.keys():
-                    self.parent._sdata[label] = to_parent
+                pdata = self.parent._sdata
+                existing = pdata.get(label)
+                if existing is None:
+                    pdata[label] = to_parent
                 else:
-                    existing = self.parent._sdata[label]
                     # if existing is nan, try to put addedum values
-                    self.parent._sdata[label] = np.where(np.isnan(existing), to_parent, existing)
+                    pdata[label] = np.where(np.isnan(existing), to_parent, existing)
         return
 
     def compute_cyclized(self, obs):
@@ -312,7 +488,7 @@ class Cell(tlib.Node):
 
         Parameters
         ----------
-        obs : Observable instance
+        obs : Observable or ObsSpec instance
             mode must be different from 'dynamics'
 
         Raises
@@ -336,60 +512,83 @@ class Cell(tlib.Node):
         an already present array from timelapse counterpart, and only if it
         fails will it compute it using only this current cell data.
         """
-        scale = obs.scale
-        npts = obs.join_points
-        label = obs.label
-        if obs.mode == 'dynamics':
+        spec = _specialize(obs)
+        scale = spec.scale
+        npts = spec.join_points
+        label = spec.label
+        mode = spec.mode
+        if mode == 'dynamics':
             raise ValueError('Called build_cyclized for dynamics mode')
+        if label in self._built_labels:
+            return
         # associate timelapse counterpart
-        cobs = obs.as_timelapse()
-        clabel = cobs.label
-        time = self.data['time']
+        cspec = spec.timelapse
+        clabel = cspec.label
+        time = self._time
         # if it has been computed already, the clabel key exists in sdata
         try:
             array = self._sdata[clabel]
         # otherwise compute the timelapse counterpart
         except KeyError:
-            self.build_timelapse(cobs)
+            self.build_timelapse(cspec)
             array = self._sdata[clabel]
         # get value
         try:                
-            if obs.mode == 'birth':
+            if mode == 'birth':
                 value = extrapolate_endpoints(time, array, self.birth_time,
                                               scale=scale, join_points=npts)
-            elif obs.mode == 'division':
+            elif mode == 'division':
                 value = extrapolate_endpoints(time, array, self.division_time,
                                               scale=scale, join_points=npts)
-            elif 'net-increase' in obs.mode:
-                dval = extrapolate_endpoints(time, array, self.division_time,
-                                              scale=scale, join_points=npts)
-                bval = extrapolate_endpoints(time, array, self.birth_time,
-                                              scale=scale, join_points=npts)
-                if obs.mode == 'net-increase-additive':
+            elif 'net-increase' in mode:
+                bval, dval = extrapolate_birth_division(time, array,
+                                                        self.birth_time,
+                                                        self.division_time,
+                                                        scale=scale,
+                                                        join_points=npts)
+                if mode == 'net-increase-additive':
                     value = dval - bval
-                elif obs.mode == 'net-increase-multiplicative':
+                elif mode == 'net-increase-multiplicative':
                     value = dval/bval
-            elif obs.mode == 'average':
+            elif mode == 'average':
                 value = np.nanmean(array)
-            elif obs.mode == 'rate':
+            elif mode == 'rate':
                 if len(array) < 2:
                     value = np.nan  # not enough values to estimate rate
-                if obs.scale == 'log':
-                    array = np.log(array)
-                value, intercept = np.polyfit(time, array, 1)
+                else:
+                    if scale == 'log':
+                        if not cspec.local_fit and not cspec.differentiate:
+                            # timelapse values are raw values
+                            array = self._log_field(spec.raw)
+                        else:
+                            array = np.log(array)
+                    value = _slope(time, array)
         except ExtrapolationError as err:
 #            msg = '{}'.format(err)
 #            warnings.warn(msg)
             value = np.nan  # missing information
         self._sdata[label] = value
+        self._built_labels.add(label)
         return
 
 
 def _disjoint_time_sets(ts1, ts2):
+    """Checks whether two time arrays span disjoint intervals
+
+    Parameters
+    ----------
+    ts1, ts2 : 1d ndarrays of floats
+        time values; NaNs are ignored
+
+    Returns
+    -------
+    bool
+        True when intervals do not overlap, or when a time set is empty
+    """
     if len(ts1) == 0 or len(ts2) == 0:
         return True
-    min1, min2 = map(np.nanmin, [ts1, ts2])
-    max1, max2 = map(np.nanmax, [ts1, ts2])
+    min1, max1 = nanminmax(ts1)
+    min2, max2 = nanminmax(ts2)
     return max1 < min2 or max2 < min1
 
 
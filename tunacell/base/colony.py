@@ -4,6 +4,8 @@
 This module defines the :class:`Colony` class that handle the tree-like
 structure made by dividing cells.
 """
+import itertools
+
 import numpy as np
 import treelib
 
@@ -12,6 +14,9 @@ from tunacell.base.lineage import Lineage
 from tunacell.filters.main import FilterTRUE
 from tunacell.filters.lineages import FilterLineage
 
+# stateless filter shared by all calls that do not filter lineages
+_ANY_LINEAGE = FilterTRUE()
+
 
 class ColonyError(Exception):
     pass
@@ -48,23 +53,30 @@ class Colony(treelib.Tree):
         self.container = container
         self.idseqs = None
         self._decomposition = None
+        self._decompositions = {}  # (independent, seed): idseqs
 
     def add_cell_recursive(self, cell):
         """Function to add nodes recursively to a tree.
 
+        Descendants are added depth-first, using an explicit stack rather
+        than recursive calls (no recursion limit on deep lineages).
+
         Parameters
         ----------
         cell : Cell instance
            must have .parent and .childs attributes up-to-date
         """
-        self.add_node(cell, parent=cell.bpointer)
-        # print 'added %s to parent %s'%(cell.identifier, cell.bpointer)
-        for ch in cell.childs:
-            if ch.bpointer == cell.identifier:
-                # we keep information about parents/childs
-                # but link only if the backpointer still points to cell
-                # which may be changed by prefiltering method
-                self.add_cell_recursive(ch)
+        stack = [cell]
+        while stack:
+            cell = stack.pop()
+            self.add_node(cell, parent=cell.bpointer)
+            # we keep information about parents/childs
+            # but link only if the backpointer still points to cell
+            # which may be changed by prefiltering method
+            childs = [ch for ch in cell.childs
+                      if ch.bpointer == cell.identifier]
+            # reversed: childs are added in the same order as recursive calls
+            stack.extend(reversed(childs))
 
     def decompose(self, independent=True, seed=None):
         """Decompose tree onto lineages, i.e. sequences of cells
@@ -82,29 +94,31 @@ class Colony(treelib.Tree):
         idseqs : list of sequences of cell identifiers composing each lineage
         """
         self._decomposition = {'independent': independent, 'seed': seed}
-        np.random.seed(seed)
+        # local generator: same draws as seeding numpy global state,
+        # without altering it
+        rng = np.random.RandomState(seed)
         if not independent:
             idseqs = self.paths_to_leaves()
         else:
-            nids = self.expand_tree(mode=self.DEPTH, key=_randomise)
             idseqs = []
             seq = []
-            for nid in nids:
+            for nid, is_leaf in _iter_dfs_random(self, rng):
                 seq.append(nid)
-                if self.get_node(nid).is_leaf():
+                if is_leaf:
                     idseqs.append(seq)
                     seq = []
         self.idseqs = idseqs
+        self._decompositions[(independent, seed)] = idseqs
         return idseqs
 
     def iter_lineages(self, independent=True, seed=None,
                       filter_for_lineages='from_fset', size=None, shuffle=False):
         """Iterates through lineages using tree decomposition
         
-        When a decomposition has already been performed, call to this method
-        will check decomposition parameters(`independent`, `seed`): if they
-        are the same, the previous cell sequences are used identically,
-        otherwise a new decomposition is computed.
+        Decompositions are stored by parameters (`independent`, `seed`): when
+        a decomposition has already been performed with the same parameters,
+        the previous cell sequences are used identically, otherwise a new
+        decomposition is computed.
         
         Parameters
         ----------
@@ -128,22 +142,17 @@ class Colony(treelib.Tree):
         --------
         decompose : tree decomposition
         """
-        new = True  # new decomposition
-        if self._decomposition is not None:
-            a = self._decomposition['independent'] == independent
-            b = self._decomposition['seed'] == seed
-            if a and b:
-                new = False
-        if new:
+        idseqs = self._decompositions.get((independent, seed))
+        if idseqs is None:
             idseqs = self.decompose(independent=independent, seed=seed)
-        else:
-            idseqs = self.idseqs[:]
         if shuffle:
+            # copy: shuffling must not alter stored decomposition
+            idseqs = list(idseqs)
             np.random.shuffle(idseqs)  # not sure it is useful...
-        if filter_for_lineages is 'from_fset':
+        if filter_for_lineages == 'from_fset':
             lineage_filter = self.container.exp.fset.lineage_filter
-        elif filter_for_lineages is None or filter_for_lineages is 'none':
-            lineage_filter = FilterTRUE()
+        elif filter_for_lineages is None or filter_for_lineages == 'none':
+            lineage_filter = _ANY_LINEAGE
         elif isinstance(filter_for_lineages, FilterLineage):
             lineage_filter = filter_for_lineages
         elif isinstance(filter_for_lineages, FilterTRUE):
@@ -151,18 +160,42 @@ class Colony(treelib.Tree):
         else:
             raise ValueError('"filter_for_lineages" parameter not recognized')
 
-        count = 0
-        for idseq in idseqs:
-            if size is not None and count > size - 1:
-                break
-            lin = Lineage(self, idseq)
-            if lineage_filter(lin):
-                count += 1
-                yield lin
+        lineages = (Lineage(self, idseq) for idseq in idseqs)
+        valid = (lin for lin in lineages if lineage_filter(lin))
+        # islice stops after size valid lineages (no limit when None)
+        for lin in itertools.islice(valid, size):
+            yield lin
+
 
+def _iter_dfs_random(tree, rng):
+    """Depth-first traversal of tree, visiting siblings in random order
 
-def _randomise(param):
-    return np.random.uniform(0, 1)
+    Random draws match those of treelib's expand_tree(mode=DEPTH) with a
+    uniform random sort key: for a given seed, node order is the same.
+
+    Parameters
+    ----------
+    tree : treelib.Tree instance
+    rng : numpy.random.RandomState instance
+
+    Yields
+    ------
+    nid : node identifier
+    is_leaf : bool
+        whether node has no children; read from the children list used for
+        the traversal, which saves a separate lookup of leaves
+    """
+    stack = [tree.root]
+    while stack:
+        nid = stack.pop()
+        childs = tree[nid].fpointer
+        yield nid, not childs
+        if childs:
+            # one key per child, drawn once for all siblings
+            keys = rng.uniform(0, 1, size=len(childs))
+            order = np.argsort(keys, kind='mergesort')
+            # last pushed is visited first
+            stack.extend(childs[index] for index in order[::-1])
 
 
 def build_recursively_from_cells(cells, container=None):
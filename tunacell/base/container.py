@@ -21,6 +21,9 @@ from tunacell.base.observable import Observable, set_observable_list
 from tunacell.filters.main import FilterTRUE
 from tunacell.filters.trees import FilterTree
 
+# stateless filter shared by all calls that do not filter colonies
+_ANY_COLONY = FilterTRUE()
+
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +121,8 @@ class Container(object):
 
         # acquisition period
         self.period = self.metadata.loc['period']
+        # inferred from data by .read_data when period is not in metadata
+        self._inferred_period = None
 
         # cases against filetype
         if self.filetype == 'text':
@@ -171,8 +176,10 @@ class Container(object):
             self.cells = build_cells(arr, container=self,
                                      extend_observables=extend_observables,
                                      report_NaNs=report_NaNs)
+            # when period is not given in metadata, infer it once from data
+            if self.period is None:
+                self._inferred_period = infer_period(self.cells)
 
-        
             self._build(prefilt=prefilt)
 
         return
@@ -240,9 +247,8 @@ class Container(object):
 
         # compute suppl obs for all cells
         if raw_obs:
-            for cell in self.cells:
-                for obs in raw_obs:
-                    cell.build(obs)
+            for obs in raw_obs:
+                Cell.build_population(self.cells, obs)
         for cell in self.cells:
             if filt is not None:
                 if not filt(cell):
@@ -265,6 +271,8 @@ class Container(object):
         for cell in self.cells:
             for obs in raw_obs:
                 del cell._sdata[obs.label]
+            # allow re-computation of everything built while filtering
+            cell._built_labels.clear()
         if verbose:
             msg = 'After filtering, we get {} cells.'.format(len(self.cells))
             print(msg)
@@ -386,10 +394,10 @@ class Container(object):
            maximal number of colonies before stopping iteration
         shuffle : bool
         """
-        if filter_for_colonies is 'from_fset':
+        if filter_for_colonies == 'from_fset':
             colony_filter = self.exp.fset.colony_filter
-        elif filter_for_colonies is None or filter_for_colonies is 'none':
-            colony_filter = FilterTRUE()
+        elif filter_for_colonies is None or filter_for_colonies == 'none':
+            colony_filter = _ANY_COLONY
         elif isinstance(filter_for_colonies, FilterTree):
             colony_filter = filter_for_colonies
         elif isinstance(filter_for_colonies, FilterTRUE):
@@ -563,3 +571,23 @@ def build_cells(arr, container=None, report_NaNs=True,
                '{}'.format(', '.join(nan_labels.keys())))
         logger.debug(msg)
     return cells
+
+
+def infer_period(cells):
+    """Infer acquisition period from time increments of cells data.
+
+    Parameters
+    ----------
+    cells : list of :class:`Cell` instances
+
+    Returns
+    -------
+    float
+        smallest time increment found within cells, rounded to 2 decimals;
+        None when no cell has at least 2 time points
+    """
+    increments = [np.diff(cell.data['time']) for cell in cells
+                  if cell.data is not None and len(cell.data) > 1]
+    if not increments:
+        return None
+    return np.round(np.amin(np.abs(np.concatenate(increments))), decimals=2)
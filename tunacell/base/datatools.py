@@ -126,11 +126,40 @@ class Coordinates(object):
 
 # NEW LOCAL FIT ESTIMATE USING ARRAYS
 
+def _linear_fit(x, y):
+    """Returns (slope, intercept) of least-square linear fit of y against x.
+
+    Closed form solution of the 2x2 normal equations, equivalent to
+    `np.polyfit(x, y, 1)` without building the Vandermonde matrix. Values are
+    centered before summation to preserve precision for large x values.
+    Unlike `np.polyfit`, degenerate inputs (single point, constant x) give
+    NaN slope and intercept.
+    """
+    slope = _slope(x, y)
+    if np.isnan(slope):
+        return np.nan, np.nan
+    return slope, np.mean(y) - slope * np.mean(x)
+
+
+def _slope(x, y):
+    """Returns the slope of least-square linear fit of y against x.
+
+    Computed as cov(x, y)/var(x) with centered values. The slope is not
+    determined when x values are all equal (or when a single point is
+    given): NaN is returned.
+    """
+    if len(x) < 2 or np.ptp(x) == 0:
+        return np.nan
+    dx = x - np.mean(x)
+    return np.dot(dx, y - np.mean(y)) / np.dot(dx, dx)
+
+
 def compute_rates(x, y, x_break=None,
                   anterior_x=[], anterior_y=[],
                   scale='log',
                   time_window=15., dt=5.,
                   join_points=3,
+                  y_operated=False,
                   testing=False):
     """Computes rates of array y against x by local fits over shifting window.
 
@@ -167,6 +196,9 @@ def compute_rates(x, y, x_break=None,
     join_points : int (default 3)
         minimal number of points used when performing local fits to make
         continuity between anterior and present timeseries
+    y_operated : bool {False, True}
+        whether y and anterior_y arrays are given in operated scale (e.g. log
+        values for 'log' scale), to reuse log values computed beforehand
     testing : bool {False, True}
         verbose output for testing
 
@@ -246,11 +278,14 @@ def compute_rates(x, y, x_break=None,
     op_y_break = None  # estimate of y value at joining (value at birth)
     op_ay_break = None  # estimate of anterior y value at joining (at division)
 
-    op_y = y_operator(coords.clear_y)
+    if y_operated:
+        op_y = coords.clear_y
+    else:
+        op_y = y_operator(coords.clear_y)
 
     if len(coords.clear_x) >= join_points:
         # fit to at least join_points, more if possible
-        r, i = np.polyfit(coords.clear_x[:n_joints], op_y[:n_joints], 1)
+        r, i = _linear_fit(coords.clear_x[:n_joints], op_y[:n_joints])
         op_y_break = i + r * x_break
 
     if testing:
@@ -263,15 +298,18 @@ def compute_rates(x, y, x_break=None,
     trans_op_ay = []  # translated, operated anterior values; default: empty
     offset = None
     if op_y_break is not None and len(anteriors.clear_x) > 0:
-        op_ay = y_operator(anteriors.clear_y)
+        if y_operated:
+            op_ay = anteriors.clear_y
+        else:
+            op_ay = y_operator(anteriors.clear_y)
         # 2 checks:
         #   1. there at enough points to get the final value estimate
         cdt1 = len(anteriors.clear_x) >= join_points
         #   2. initial value is determined
         cdt2 = op_y_break is not None
         if cdt1 and cdt2:
-            r, i = np.polyfit(anteriors.clear_x[-n_joints:],
-                              op_ay[-n_joints:], 1)
+            r, i = _linear_fit(anteriors.clear_x[-n_joints:],
+                               op_ay[-n_joints:])
             op_ay_break = i + r * x_break
             if testing:
                 msg = ('Extrapolated anterior value at break:\n '
@@ -300,49 +338,17 @@ def compute_rates(x, y, x_break=None,
         all_op_y = op_y
     all_y = y_inv_operator(all_op_y)
 
-    fit_x = np.zeros_like(all_x)
-    fit_op_y = np.zeros_like(all_x)  # fitted values
-    rate_op_y = np.zeros_like(all_x)   # rates of local fits
-
-    # sliding window
-    for index, t in enumerate(all_x):
-        t_start = t - period/2.  # convention
-        t_stop = t_start + time_window
-        # time of evaluation
-        time_eval = (t_start + t_stop)/2.
-        fit_x[index] = time_eval
-        # check that at least one time point is larger than break point
-        if t_stop <= x_break:
-            fit_op_y[index] = np.nan
-            rate_op_y[index] = np.nan
-            if testing:
-                msg = ('+ window range does not intercept x range: next')
-                print(msg)
-            continue
-        # reduce to points to fit
-        lower = all_x > t_start
-        upper = all_x <= t_stop
-        boo = np.logical_and(lower, upper)
-        if testing:
-            print('+ window:', end=' ')
-            print('{} < t < {} '.format(t_start, t_stop), end=' ')
-            print('({} points)'.format(len(all_x[boo])))
-        # check if n_points > 3
-        if len(all_x[boo]) < n_points:
-            if testing:
-                print('Not enough points on this time window')
-                print('({} instead of {})'.format(len(all_x[boo]), n_points))
-                print('next')
-            # not enough point in this window: insert NaN
-            rate_op_y[index] = np.nan
-            fit_op_y[index] = np.nan
-        else:
-            rate, intercept = np.polyfit(all_x[boo], all_op_y[boo], 1)
-            fit_op_y[index] = rate * time_eval + intercept
-            rate_op_y[index] = rate
-            if testing:
-                msg = ('time          : {}'.format(time_eval) + '\n'
-                       'fitted value  : {}'.format(fit_op_y[index]) + '\n'
+    # sliding window: all windows are fitted at once
+    fit_x, fit_op_y, rate_op_y, counts = _sliding_window_fits(
+        all_x, all_op_y, period=period, time_window=time_window,
+        n_points=n_points, x_break=x_break)
+    if testing:
+        for time_eval, count, fit, rate in zip(fit_x, counts, fit_op_y,
+                                               rate_op_y):
+            print('+ window centered on {}'.format(time_eval), end=' ')
+            print('({} points)'.format(count))
+            if not np.isnan(rate):
+                msg = ('fitted value  : {}'.format(fit) + '\n'
                        'computed rate : {}'.format(rate))
                 print(msg)
 
@@ -373,6 +379,77 @@ def compute_rates(x, y, x_break=None,
     return out_rate, out_y, out_anterior_rate, out_anterior_y, all_x, all_y
 
 
+def _sliding_window_fits(x, y, period, time_window, n_points, x_break):
+    """Performs linear fits of y against x over shifting time windows
+
+    The window associated to each point x[i] is (x[i] - period/2,
+    x[i] - period/2 + time_window]. All windows are processed with array
+    operations: points of each window are gathered in a 2d (windows, points)
+    array and closed form least-square fits are computed row-wise.
+
+    Parameters
+    ----------
+    x : 1d ndarray
+        co-ordinates (no NaNs)
+    y : 1d ndarray
+        ordinates (operated values), same length as x
+    period : float
+        acquisition period
+    time_window : float
+        size of time window
+    n_points : int
+        minimal number of points in window to perform fit
+    x_break : float
+        windows ending before x_break are not evaluated
+
+    Returns
+    -------
+    fit_x : 1d ndarray
+        time of evaluation of each window (window center)
+    fit_y : 1d ndarray
+        fitted value at window center (NaN when window is not evaluated)
+    rates : 1d ndarray
+        slope of local fit (NaN when window is not evaluated)
+    counts : 1d ndarray of int
+        number of points in each window
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    t_start = x - period/2.  # convention
+    t_stop = t_start + time_window
+    fit_x = (t_start + t_stop)/2.
+    fit_y = np.full(len(x), np.nan)
+    rates = np.full(len(x), np.nan)
+    if len(x) == 0:
+        return fit_x, fit_y, rates, np.zeros(0, dtype=int)
+    # windows are contiguous index ranges over sorted co-ordinates
+    order = np.argsort(x, kind='mergesort')
+    sx = x[order]
+    sy = y[order]
+    lower = np.searchsorted(sx, t_start, side='right')
+    upper = np.searchsorted(sx, t_stop, side='right')
+    counts = upper - lower
+    # check that at least one time point is larger than break point
+    todo = np.logical_and(t_stop > x_break, counts >= n_points)
+    if not np.any(todo):
+        return fit_x, fit_y, rates, counts
+    lower = lower[todo]
+    sizes = counts[todo]
+    offsets = np.arange(np.amax(sizes))
+    mask = offsets[np.newaxis, :] < sizes[:, np.newaxis]
+    indices = np.where(mask, lower[:, np.newaxis] + offsets, 0)
+    wx = np.where(mask, sx[indices], 0.)
+    wy = np.where(mask, sy[indices], 0.)
+    x_mean = np.sum(wx, axis=1) / sizes
+    y_mean = np.sum(wy, axis=1) / sizes
+    dx = np.where(mask, wx - x_mean[:, np.newaxis], 0.)
+    dy = np.where(mask, wy - y_mean[:, np.newaxis], 0.)
+    slopes = np.sum(dx * dy, axis=1) / np.sum(dx * dx, axis=1)
+    rates[todo] = slopes
+    fit_y[todo] = y_mean + slopes * (fit_x[todo] - x_mean)
+    return fit_x, fit_y, rates, counts
+
+
 class ExtrapolationError(Exception):
     pass
 
@@ -422,9 +499,68 @@ def extrapolate_endpoints(x, y, x_target,
         when extrapolation fails due to too less points, or
         when closest x to x_target is further away than distance_max
     """
+    _check_target(x_target)
+    clear_x, op_values, y_inv_operator = _prepare_extrapolation(
+        x, y, scale=scale, join_points=join_points)
+    return _extrapolate_prepared(clear_x, op_values, y_inv_operator, x_target,
+                                 join_points=join_points,
+                                 distance_max=distance_max)
+
+
+def extrapolate_birth_division(x, y, birth_time, division_time,
+                               scale='log', join_points=3,
+                               distance_max=None):
+    """Extrapolate y values at both birth_time and division_time
+
+    Equivalent to two calls to :func:`extrapolate_endpoints`, but cleaning
+    NaNs and applying the scale operator are performed only once.
+
+    Parameters
+    ----------
+    x : 1d ndarray
+        co-ordinate array (usually array of times for timeseries)
+    y : 1d ndarray
+        ordinate (array of values of same length as x array)
+    birth_time : float
+        first value of co-ordinate at which y is inter-/extra-polated
+    division_time : float
+        second value of co-ordinate at which y is inter-/extra-polated
+    scale : str {'linear', 'log'}
+        expected scale of y versus x. For exponential growth, use 'log' scale.
+    join_points : int (default 3)
+        minimal number of points used when performing local fits
+    distance_max : float (default None)
+        upper bound to the distance between closest x to x_target to accept
+        extrapolation
+
+    Returns
+    -------
+    (float, float)
+        values estimated at birth_time, and division_time
+
+    Raises
+    ------
+    ExtrapolationError
+        when any of the two extrapolations fails
+    """
+    _check_target(division_time)
+    _check_target(birth_time)
+    clear_x, op_values, y_inv_operator = _prepare_extrapolation(
+        x, y, scale=scale, join_points=join_points)
+    bval, dval = [_extrapolate_prepared(clear_x, op_values, y_inv_operator,
+                                        x_target, join_points=join_points,
+                                        distance_max=distance_max)
+                  for x_target in (birth_time, division_time)]
+    return bval, dval
+
+
+def _check_target(x_target):
     if x_target is None or np.isnan(x_target):
         raise NoTarget('x_target: {} is not a number'.format(x_target))
-    npts = join_points
+
+
+def _prepare_extrapolation(x, y, scale='log', join_points=3):
+    """Returns NaN-cleared x, operated y values, and inverse operator"""
     if scale == 'log':
         y_operator = np.log
         y_inv_operator = np.exp
@@ -437,24 +573,29 @@ def extrapolate_endpoints(x, y, x_target,
     if len(coords.clear_x) < join_points:
         raise TooFewPoints('{} < {}'.format(len(coords.clear_x), join_points))
 
-    op_values = y_operator(coords.clear_y)
+    return coords.clear_x, y_operator(coords.clear_y), y_inv_operator
 
+
+def _extrapolate_prepared(clear_x, op_values, y_inv_operator, x_target,
+                          join_points=3, distance_max=None):
+    """Extrapolate operated values at x_target (see extrapolate_endpoints)"""
+    npts = join_points
     # when target is inside : interpolate
-    if np.amin(coords.clear_x) <= x_target <= np.amax(coords.clear_x):
-        f = interp1d(coords.clear_x, op_values, kind='linear',
+    if np.amin(clear_x) <= x_target <= np.amax(clear_x):
+        f = interp1d(clear_x, op_values, kind='linear',
                      bounds_error=False)
         return y_inv_operator(f(x_target))
 
     # othgerwise we extrapolate
     if distance_max is not None:
-        dist = np.amin(np.abs(coords.clear_x - x_target))
+        dist = np.amin(np.abs(clear_x - x_target))
         if dist > distance_max:
             msg = ('Distance to target: {} > {}'.format(dist, distance_max))
             raise TooRemoteFromTarget(msg)
-    if x_target > np.amax(coords.clear_x):
-        rate, intercept = np.polyfit(coords.clear_x[-npts:], op_values[-npts:], 1)
+    if x_target > np.amax(clear_x):
+        rate, intercept = np.polyfit(clear_x[-npts:], op_values[-npts:], 1)
     else:
-        rate, intercept = np.polyfit(coords.clear_x[:npts], op_values[:npts], 1)
+        rate, intercept = np.polyfit(clear_x[:npts], op_values[:npts], 1)
 
     return y_inv_operator(rate * x_target + intercept)
 
@@ -496,24 +637,46 @@ def derivative(coords):
         finite differences interpolated at original times where values are
         non nans.
     """
-    out_y = np.array(len(coords.x) * [np.nan, ])
-    clears = coords.clear
+    return Coordinates(coords.x, _derivative(coords.x, coords.y))
+
+
+def logderivative(coords):
+    return Coordinates(coords.x, _logderivative(coords.x, coords.y))
+
+
+def _derivative(x, y):
+    """Array version of :func:`derivative`, returns the array of derivatives
+
+    Parameters
+    ----------
+    x : 1d ndarray
+        co-ordinate array (usually array of times for timeseries)
+    y : 1d ndarray
+        ordinate (array of values of same length as x array)
+
+    Returns
+    -------
+    1d ndarray
+        finite differences interpolated at x where values are non nans,
+        NaNs elsewhere.
+    """
+    out_y = np.full(len(x), np.nan)
+    valid = np.logical_not(np.logical_or(np.isnan(x), np.isnan(y)))
+    clear_x = x[valid]
+    clear_y = y[valid]
     # one need at least three valid values to get estimates of 2 points
-    if len(clears) < 3:
-        return Coordinates(coords.x, out_y)  # return only nans, deal with it
-    delta_x = additive_increments(clears.x)
-    delta_y = additive_increments(clears.y)
-    new_x = (clears.x[1:] + clears.x[:-1])/2.
-    new_y = delta_y/delta_x
+    if len(clear_x) < 3:
+        return out_y  # return only nans, deal with it
+    new_x = (clear_x[1:] + clear_x[:-1])/2.
+    new_y = np.diff(clear_y)/np.diff(clear_x)
     # interpolate to associate to initial times : at least 2 valid points
-    f = interp1d(new_x, new_y, kind='linear', assume_sorted=True, bounds_error=False)
-    out_y[coords.valid] = f(coords.clear_x)
-    return Coordinates(coords.x, out_y)
+    out_y[valid] = np.interp(clear_x, new_x, new_y, left=np.nan, right=np.nan)
+    return out_y
 
 
-def logderivative(coords):
-    logcoords = Coordinates(coords.x, np.log(coords.y))
-    return derivative(logcoords)
+def _logderivative(x, y):
+    """Array version of :func:`logderivative`"""
+    return _derivative(x, np.log(y))
 
 
 #  list of operators acting on 1-D arrays
@@ -550,6 +713,91 @@ def multiplicative_increments(ar):
     return a/b
 
 
+def nanminmax(ar):
+    """Computes minimum and maximum values, ignoring NaNs.
+
+    Uses fmin/fmax reductions, which skip NaNs without building a mask and
+    have a lower call overhead than np.nanmin/np.nanmax on small arrays.
+
+    Parameter
+    ---------
+    ar : 1d Numpy ndarray, non empty
+
+    Returns
+    -------
+    (min, max) : couple of floats
+        NaN values when all items are NaN
+    """
+    return np.fmin.reduce(ar), np.fmax.reduce(ar)
+
+
+# operators acting on concatenated segments of 1-D arrays
+
+def segment_nanmeans(values, lengths):
+    """Computes the mean of each segment, ignoring NaNs.
+
+    Parameters
+    ----------
+    values : 1d ndarray
+        concatenation of all segments
+    lengths : 1d ndarray of int
+        length of each segment (zero length segments are allowed)
+
+    Returns
+    -------
+    1d ndarray
+        one mean per segment, NaN for segments without valid values
+    """
+    lengths = np.asarray(lengths, dtype=int)
+    valid = np.logical_not(np.isnan(values))
+    out = np.full(len(lengths), np.nan)
+    filled = lengths > 0
+    if not np.any(filled):
+        return out
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])[filled]
+    sums = np.add.reduceat(np.where(valid, values, 0.), starts)
+    counts = np.add.reduceat(valid.astype(int), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out[filled] = np.where(counts > 0, sums / counts, np.nan)
+    return out
+
+
+def segment_slopes(x, y, lengths):
+    """Computes the slope of the linear fit of y against x for each segment.
+
+    Uses the closed form slope cov(x, y)/var(x), centered segment-wise.
+    NaN values propagate to their segment result.
+
+    Parameters
+    ----------
+    x : 1d ndarray
+        concatenation of co-ordinates of all segments
+    y : 1d ndarray
+        concatenation of ordinates of all segments, same length as x
+    lengths : 1d ndarray of int
+        length of each segment (zero length segments are allowed)
+
+    Returns
+    -------
+    1d ndarray
+        one slope per segment, NaN for segments with less than 2 points
+    """
+    lengths = np.asarray(lengths, dtype=int)
+    out = np.full(len(lengths), np.nan)
+    filled = lengths > 0
+    if not np.any(filled):
+        return out
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])[filled]
+    sizes = lengths[filled]
+    dx = x - np.repeat(np.add.reduceat(x, starts) / sizes, sizes)
+    dy = y - np.repeat(np.add.reduceat(y, starts) / sizes, sizes)
+    sxy = np.add.reduceat(dx * dy, starts)
+    sxx = np.add.reduceat(dx * dx, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out[filled] = np.where(sizes > 1, sxy / sxx, np.nan)
+    return out
+
+
 # functions acting on structured arrays
 
 def compute_secondary_observables(data):
@@ -9,6 +9,7 @@ import numpy as np
 import random
 
 from tunacell.base.datatools import Coordinates
+from tunacell.base.cell import _specialize
 from tunacell.base.timeseries import TimeSeries
 from tunacell.base.observable import Observable, FunctionalObservable
 
@@ -158,16 +159,16 @@ class Lineage(object):
             select_ids[repr(fset)] = arrbool
         return select_ids
 
-    def get_timeseries(self, obs, raw_obs=[], func_obs=[], cset=[]):
+    def get_timeseries(self, obs, raw_obs=None, func_obs=None, cset=[]):
         """Contructs timeseries.
 
         Parameters
         ----------
         obs : :class:`Observable` or :class:`FunctionalObservable` instance
             must be an item of raw_obs or an item of func_obs
-        raw_obs : list of :class:`Observable` instances
+        raw_obs : list of :class:`Observable` instances (default None)
             needed to be computed for filtering or in the case of FunctionalObservable
-        func_obs : list of :class:`FunctionalObservable` instances
+        func_obs : list of :class:`FunctionalObservable` instances (default None)
             needed to be computed for filtering
         cset: sequence of :class:`FilterSet` instances (default [])
 
@@ -176,35 +177,67 @@ class Lineage(object):
         :class:`TimeSeries` instance
             corresponding to obs argument
         """
-        label = obs.label  # complicated string
-        if obs.name is not None:
-            obs_name = obs.name  # simpler string if provided by user
-        else:
-            obs_name = label
-        
-        # obs must be either a member of raw_obs, or a member of func_obs
-        if isinstance(obs, Observable):
-            if obs not in raw_obs:
-                raw_obs.append(obs)
-        elif isinstance(obs, FunctionalObservable):
-            if obs not in func_obs:
-                func_obs.append(obs)
-        else:
-            raise TypeError('obs must be one of {Observable, FunctionalObservable}')
+        return self.get_timeseries_many([obs, ], raw_obs=raw_obs,
+                                        func_obs=func_obs, cset=cset)[0]
+
+    def get_timeseries_many(self, observables, raw_obs=None, func_obs=None,
+                            cset=[]):
+        """Contructs timeseries of several observables in a single pass.
+
+        Cell data is built once for all observables, and cell time bounds
+        and boolean tests are evaluated once, then shared by all timeseries.
+
+        Parameters
+        ----------
+        observables : list of :class:`Observable` or :class:`FunctionalObservable` instances
+            each item must be an item of raw_obs or an item of func_obs
+        raw_obs : list of :class:`Observable` instances (default None)
+            needed to be computed for filtering or in the case of FunctionalObservable
+        func_obs : list of :class:`FunctionalObservable` instances (default None)
+            needed to be computed for filtering
+        cset: sequence of :class:`FilterSet` instances (default [])
+
+        Returns
+        -------
+        tuple of :class:`TimeSeries` instances
+            one per item of observables, in the same order
+        """
+        # fresh lists: arguments (and defaults) are never modified
+        raw_obs = list(raw_obs) if raw_obs is not None else []
+        func_obs = list(func_obs) if func_obs is not None else []
+        # obs must be either a member of raw_obs, or a member of func_obs:
+        # as in set_observable_list, identically defined observables match
+        raw_keys = set(sobs._key for sobs in raw_obs)
+        func_keys = set(fobs._key for fobs in func_obs)
+        for obs in observables:
+            if isinstance(obs, Observable):
+                if obs._key not in raw_keys:
+                    raw_keys.add(obs._key)
+                    raw_obs.append(obs)
+            elif isinstance(obs, FunctionalObservable):
+                if obs._key not in func_keys:
+                    func_keys.add(obs._key)
+                    func_obs.append(obs)
+            else:
+                raise TypeError('obs must be one of {Observable, FunctionalObservable}')
 
+        # observable specifications are computed once for all cells
+        specs = [_specialize(sobs) for sobs in raw_obs]
+        timelapsed = [sobs.as_timelapse() for sobs in raw_obs]
+        timelapsed_specs = [_specialize(tobs) for tobs in timelapsed]
         # compute timelapsed raw obs for all cells in lineage
         for cell in self.cellseq:
-            for sobs in raw_obs:
-                cell.build(sobs.as_timelapse())
+            for tobs, tspec in zip(timelapsed, timelapsed_specs):
+                cell.build(tobs, spec=tspec)
         # now that all timelapse observables have been computed, there cannot
         # be overlap between different cell in data evaluation,
         #and we protect against future build
         time_bounds = []
         for cell in self.cellseq:
             # compute those that are of cell-cycle mode
-            for sobs in raw_obs:
+            for sobs, spec in zip(raw_obs, specs):
                 if sobs.mode != 'dynamics':
-                    cell.build(sobs)
+                    cell.build(sobs, spec=spec)
                 # protect against future build for raw observable
                 cell.protect_against_build(sobs)
             for fobs in func_obs:
@@ -229,6 +262,34 @@ class Lineage(object):
         # boolean tests
         select_ids = self.get_boolean_tests(cset)
 
+        return tuple(self._assemble_timeseries(obs, time_bounds, select_ids)
+                     for obs in observables)
+
+    def _assemble_timeseries(self, obs, time_bounds, select_ids):
+        """Collects built cell data of obs as a :class:`TimeSeries` instance
+
+        Parameters
+        ----------
+        obs : :class:`Observable` or :class:`FunctionalObservable` instance
+            must have been built for all cells of current lineage
+        time_bounds : list of couples of floats
+            (left, right) time bounds of each cell
+        select_ids : dict
+            output of :meth:`get_boolean_tests`
+
+        Returns
+        -------
+        :class:`TimeSeries` instance
+        """
+        label = obs.label  # complicated string
+        if obs.name is not None:
+            obs_name = obs.name  # simpler string if provided by user
+        else:
+            obs_name = label
+        # timeseries must not share mutable containers
+        time_bounds = list(time_bounds)
+        select_ids = dict(select_ids)
+
         arrays = []
         index_cycles = []
         colony = self.colony
@@ -11,26 +11,46 @@ Classes
 """
 from __future__ import print_function
 
-import collections
 import warnings
 import inspect
 import dill
 import re
-from copy import deepcopy
 
 from tabulate import tabulate
 
+try:
+    from collections.abc import Iterable  # python3
+except ImportError:
+    from collections import Iterable  # python2
 
-_re_codestring = 'T([a-z])([a-z]*\d*[\.,]*\d*)M([a-z\-]+)J(\d+)'
+
+_re_codestring = r'T([a-z])([a-z]*\d*[\.,]*\d*)M([a-z\-]+)J(\d+)'
+
+# patterns compiled once, used when parsing codestrings
+_CODESTRING_RE = re.compile(_re_codestring)
+_WFIT_RE = re.compile(r'W(\d*[.,]*\d*)')
 
 
 def _is_valid_codestring(codestring):
-    chain = re.compile(_re_codestring)
-    m = chain.match(codestring)
-    if m:
-        return True
-    else:
-        return False
+    return _CODESTRING_RE.match(codestring) is not None
+
+
+#: Observable parameters, in the order used for representation
+_PARAMETER_NAMES_ORDERED = ('name',
+                            'raw',
+                            'scale',
+                            'differentiate',
+                            'local_fit',
+                            'time_window',
+                            'join_points',
+                            'mode',
+                            'timing',
+                            'tref')
+_PARAMETER_NAMES = frozenset(_PARAMETER_NAMES_ORDERED)
+# Observable representation, e.g. "Observable(name='length', raw=..., )"
+_REPR_TEMPLATE = ('{}(' +
+                  ''.join(['{}={{!r}}, '.format(key)
+                           for key in _PARAMETER_NAMES_ORDERED]) + ')')
 
 
 class ObservableError(Exception):
@@ -101,20 +121,16 @@ class Observable(object):
 
     """
 
+    __slots__ = _PARAMETER_NAMES_ORDERED + ('_label_cache', '_repr_cache',
+                                           '_key_cache', '_is_timelapse')
+
+    #: parameter names, shared by all instances
+    _attr_names = _PARAMETER_NAMES_ORDERED
+
     def __init__(self, name=None, from_string=None,
                  raw=None, differentiate=False, scale='linear',
                  local_fit=False, time_window=0., join_points=3,
                  mode='dynamics', timing='t', tref=None):
-        self._attr_names = ['name',
-                            'raw',
-                            'scale',
-                            'differentiate',
-                            'local_fit',
-                            'time_window',
-                            'join_points',
-                            'mode',
-                            'timing',
-                            'tref']
         if from_string is not None:
             self.load_from_string(from_string)
         else:
@@ -135,16 +151,35 @@ class Observable(object):
                 self.name = self.label  # use the codestring
         return
 
+    def _clone(self):
+        """Returns a copy of current observable
+
+        All parameters are immutable (str, float, int, bool or None): copying
+        the slot values is enough.
+        """
+        new = self.__class__.__new__(self.__class__)
+        for key in Observable.__slots__:
+            try:
+                object.__setattr__(new, key, getattr(self, key))
+            except AttributeError:  # unset slot
+                pass
+        return new
+
+    def __deepcopy__(self, memo):
+        new = self._clone()
+        memo[id(self)] = new
+        return new
+
     def as_timelapse(self):
         """Convert current observable to its dynamic counterpart
 
         This is needed when computing cell-cycle observables.
         """
-        if self.mode == 'dynamics' and self.timing == 't':
+        if self._is_timelapse:
             # everything's fine
             return self
         else:
-            tobs = deepcopy(self)
+            tobs = self._clone()
             tobs.mode = 'dynamics'
             tobs.timing = 't'
             tobs.name = '_timelapsed_' + self.name
@@ -165,7 +200,12 @@ class Observable(object):
         :func:`__repr__` : returns another string representation, that can be
         called by the built-in :func:`eval()`, to instantiate a new object
         with identical functional parameters.
+
+        The string is cached, and reset when a parameter is set.
         """
+        cached = getattr(self, '_label_cache', None)
+        if cached is not None:
+            return cached
         msg = ''
         # timing is in between T flags
         if self.tref is not None:
@@ -187,6 +227,7 @@ class Observable(object):
         if self.scale == 'log':
             msg += 'log_'
         msg += self.raw
+        self._label_cache = msg
         return msg
 
     @label.setter
@@ -218,8 +259,7 @@ class Observable(object):
             warnings.warn(msg)
 
         # test whether codestring is valid: must have T and M flags
-        chain = re.compile(_re_codestring)
-        m = chain.match(codestring)
+        m = _CODESTRING_RE.match(codestring)
         if m:
             timing, stref, mode, sjoin = m.groups()
             self.timing = timing
@@ -236,11 +276,9 @@ class Observable(object):
             raise ObservableStringError('Not a valid codestring')
 
         # try to check whether local fit is performed and its parameters
-        pfit = re.compile('W(\d*[.,]*\d*)')
-
         for item in items[:-1]:
             # local_fit?
-            m = pfit.search(item)
+            m = _WFIT_RE.search(item)
             if m is not None:
                 stime_window, = m.groups()
                 # check that tw_str is not empty
@@ -258,10 +296,7 @@ class Observable(object):
         """Human readable output as a table.
         """
         tab = [['parameter', 'value']]
-        for key in self._attr_names:
-            val = self.__getattribute__(key)
-            tab.append([key, val])
-
+        tab.extend([key, getattr(self, key)] for key in self._attr_names)
         return tabulate(tab, headers='firstrow')
 
 
@@ -293,36 +328,38 @@ class Observable(object):
         Returns
         -------
         """
-        output = r'$'
+        parts = ['$']
         if self.name is not None and not as_description:
             if use_name is None:
-                output += '\\mathrm{{ {} }}'.format(self.name.replace('-', '\, ').replace('_', '\ '))
+                name = self.name.replace('-', '\\, ').replace('_', '\\ ')
             else:
-                output += '\\mathrm{{ {} }}'.format(use_name)
+                name = use_name
+            parts.append('\\mathrm{{ {} }}'.format(name))
         else:
             # give all details using raw and operations on it
+            log_derivative = self.differentiate and self.scale == 'log'
             if self.differentiate:
-                output += '\\frac{\\mathrm{d}}{\\mathrm{d}t}'
-                if self.scale == 'log':
-                    output += '\\log\\left['  # parenthesis started
+                parts.append('\\frac{\\mathrm{d}}{\\mathrm{d}t}')
+                if log_derivative:
+                    parts.append('\\log\\left[')  # parenthesis started
             variable_name = '{}'.format(self.raw)
-            output += '\\mathrm{{ {} }}'.format(variable_name.replace('_', '\ ').replace('-', '\, '))
-            if self.differentiate and self.scale == 'log':
-                output += '\\right]'  # parenthesis closed
+            parts.append('\\mathrm{{ {} }}'.format(
+                variable_name.replace('_', '\\ ').replace('-', '\\, ')))
+            if log_derivative:
+                parts.append('\\right]')  # parenthesis closed
             if self.mode != 'dynamics':
-                output += '_{{\mathrm{{ {} }} }}'.format(self.mode)
-
+                parts.append('_{{\\mathrm{{ {} }} }}'.format(self.mode))
 
         if show_variable:
             time_var = _latexify_time_var(self, prime_time=prime_time,
                                            shorten_time_variable=shorten_time_variable,
                                            plus_delta=plus_delta)
-            output += '\\left( {} \\right)'.format(time_var)
+            parts.append('\\left( {} \\right)'.format(time_var))
 
         if self.local_fit and as_description:
-            output += '\\ [window: {}]'.format(self.time_window)
-        output += '$'
-        return output
+            parts.append('\\ [window: {}]'.format(self.time_window))
+        parts.append('$')
+        return ''.join(parts)
 
     @property
     def as_latex_string(self):
@@ -334,14 +371,36 @@ class Observable(object):
 #        return self.label
 
     def __repr__(self):
-        name = type(self).__name__
-        chain = name + '('
-        for key in self._attr_names:
-            val = self.__getattribute__(key)
-            chain += '{}={}, '.format(key, repr(val))
-        chain += ')'
+        cached = getattr(self, '_repr_cache', None)
+        if cached is not None:
+            return cached
+        chain = _REPR_TEMPLATE.format(type(self).__name__,
+                                      *(getattr(self, key)
+                                        for key in _PARAMETER_NAMES_ORDERED))
+        self._repr_cache = chain
         return chain
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # label and repr strings depend on parameters: reset cached strings
+        if name in _PARAMETER_NAMES:
+            object.__setattr__(self, '_label_cache', None)
+            object.__setattr__(self, '_repr_cache', None)
+            object.__setattr__(self, '_key_cache', None)
+            if name in ('mode', 'timing'):
+                is_timelapse = (getattr(self, 'mode', None) == 'dynamics' and
+                                getattr(self, 'timing', None) == 't')
+                object.__setattr__(self, '_is_timelapse', is_timelapse)
+
+    @property
+    def _key(self):
+        """Tuple of parameter values: equal for identically defined observables"""
+        cached = getattr(self, '_key_cache', None)
+        if cached is None:
+            cached = tuple(getattr(self, key) for key in self._attr_names)
+            self._key_cache = cached
+        return cached
+
 
 def _latexify_time_var(obs, prime_time=False,
                                 shorten_time_variable=False,
@@ -431,6 +490,8 @@ class FunctionalObservable(object):
     AND keeping a human-readable format to read its definition.
     """
 
+    __slots__ = ('name', 'f', '_source_f', 'observables', 'raw_observables')
+
     def __init__(self, name=None, f=None, observables=[]):
         if name is None:
             raise ValueError('name must be a unique name string')
@@ -438,11 +499,10 @@ class FunctionalObservable(object):
         if not callable(f):
             raise ValueError('f must be callable')
         self.f = f
-        self.source_f = dill.dumps(f)
-        argspec = inspect.getargspec(f)
+        self._source_f = None  # serialized on demand, see source_f
         self.observables = observables
         self.raw_observables = unroll_raw_obs(observables)
-        if len(observables) != len(argspec.args):
+        if len(observables) != _count_positional_args(f):
             msg = ('length of observable list must match number of arguments of f ')
             raise ValueError(msg)
         for obs in observables:
@@ -452,6 +512,18 @@ class FunctionalObservable(object):
                 raise TypeError(msg)
         return
 
+    @property
+    def _key(self):
+        """Name and label: equal for identically defined observables"""
+        return (self.name, self.label)
+
+    @property
+    def source_f(self):
+        """Serialized function (with dill), computed on first access"""
+        if self._source_f is None:
+            self._source_f = dill.dumps(self.f)
+        return self._source_f
+
     @property
     def timing(self):
         """Return timing depending on observables passed as parameters"""
@@ -530,6 +602,21 @@ class FunctionalObservable(object):
         return output
 
 
+def _count_positional_args(f):
+    """Returns the number of positional arguments of callable f"""
+    code = getattr(f, '__code__', None)
+    if code is not None:  # python functions
+        return code.co_argcount
+    # other callables
+    try:
+        parameters = inspect.signature(f).parameters.values()  # python3
+    except AttributeError:
+        return len(inspect.getargspec(f).args)  # python2
+    kinds = (inspect.Parameter.POSITIONAL_ONLY,
+             inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    return len([p for p in parameters if p.kind in kinds])
+
+
 def unroll_raw_obs(obs):
     """Returns a generator over flattened list of Observable instances
 
@@ -546,14 +633,14 @@ def unroll_raw_obs(obs):
     """
     if isinstance(obs, Observable):
         yield obs
-    elif isinstance(obs, collections.Iterable):
-        for item in obs:
-            for elem in unroll_raw_obs(item):
-                yield elem
     elif isinstance(obs, FunctionalObservable):
         for item in obs.observables:
             for elem in unroll_raw_obs(item):
                 yield elem
+    elif isinstance(obs, Iterable):
+        for item in obs:
+            for elem in unroll_raw_obs(item):
+                yield elem
 
 def unroll_func_obs(obs):
     """Returns flattened list of FunctionalObservable instances
@@ -580,7 +667,7 @@ def unroll_func_obs(obs):
             for elem in unroll_func_obs(item):
                 yield elem
         yield obs
-    elif isinstance(obs, collections.Iterable):
+    elif isinstance(obs, Iterable):
         for item in obs:
             for elem in unroll_func_obs(item):
                 yield elem
@@ -604,25 +691,25 @@ def set_observable_list(*args, **kwargs):
     """
     raw_obs = []
     func_obs = []
+    # keys of observables already listed: observables defined with the same
+    # parameters are listed once
+    raw_keys = set()
+    func_keys = set()
     # run through observables used in filtering
     filters = []
     if 'filters' in kwargs:
         filters.extend(kwargs['filters'])
-    for filt in filters:
-        for obs in unroll_raw_obs(filt.obs):
-            if obs not in raw_obs:
-                raw_obs.append(obs)
-        for obs in unroll_func_obs(filt.obs):
-            if obs not in func_obs:
-                func_obs.append(obs)
-    for observable in args:
+    sources = [filt.obs for filt in filters] + list(args)
+    for observable in sources:
         # extend with all raw Observable instances found in obs
         for obs in unroll_raw_obs(observable):
-            if obs not in raw_obs:
+            if obs._key not in raw_keys:
+                raw_keys.add(obs._key)
                 raw_obs.append(obs)
         # extend with all FunctionalObservable instances found in obs
         for obs in unroll_func_obs(observable):
-            if obs not in func_obs:
+            if obs._key not in func_keys:
+                func_keys.add(obs._key)
                 func_obs.append(obs)
     return raw_obs, func_obs
 
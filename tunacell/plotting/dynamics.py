@@ -7,20 +7,25 @@ from __future__ import print_function
 
 import os
 import numpy as np
-import collections
 import logging
+try:
+    from collections.abc import Iterable  # python3
+except ImportError:
+    from collections import Iterable  # python2
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib import ticker
 import matplotlib.gridspec as gridspec
+from matplotlib.collections import PolyCollection
 
 from tunacell.filters.main import FilterSet
 from tunacell.stats.single import Univariate, StationaryUnivariate
 from tunacell.stats.two import StationaryBivariate
 from tunacell.io import text
 
-from .helpers import _set_axis_limits, _set_timelabel, _set_time_axis_ticks
+from .helpers import (_set_axis_limits, _set_timelabel, _set_time_axis_ticks,
+                      _update_bounds, _set_offset_texts, _band_polygons)
 
 
 # few variables that will be used through all functions
@@ -47,39 +52,46 @@ def _set_condition_list(univariate, show_cdts='master'):
         conditions = ['master', ] + univariate.cset
     elif show_cdts == 'master':
         pass
-    elif isinstance(show_cdts, collections.Iterable):
-        for item in show_cdts:
-            _append_cdt(univariate, item, conditions)
     else:
-        _append_cdt(univariate, show_cdts, conditions)
+        # lookups are built once, first condition wins for a given repr
+        cdts_by_id = {id(cdt): cdt for cdt in univariate.cset}
+        cdts_by_repr = {}
+        for cdt in univariate.cset:
+            cdts_by_repr.setdefault(repr(cdt), cdt)
+        # a string is iterable, but names a single condition
+        if isinstance(show_cdts, Iterable) and not isinstance(show_cdts, str):
+            for item in show_cdts:
+                _append_cdt(cdts_by_id, cdts_by_repr, item, conditions)
+        else:
+            _append_cdt(cdts_by_id, cdts_by_repr, show_cdts, conditions)
     return conditions
 
 
-def _append_cdt(univariate, this_cdt, cdt_list):
+def _append_cdt(cdts_by_id, cdts_by_repr, this_cdt, cdt_list):
     """Append condition associated to this_cdt in univariate object to cdt_list
 
     Parameters
     ----------
-    univariate : :class:`Univariate` instance
+    cdts_by_id : dict
+        conditions stored in univariate, keyed by their id
+    cdts_by_repr : dict
+        conditions stored in univariate, keyed by their repr
     this_cdt : str or :class:`FilterSet` instance
         either the condition instance or its string representation
     cdt_list : list of conditions
         list of conditions to append condition to
     """
-    found = False
+    # TODO : compare also cdt.label
     if isinstance(this_cdt, str):
-        # find which
-        for cdt in univariate.cset:
-            # TODO : compare also cdt.label
-            if repr(cdt) == this_cdt:
-                found = True
-                break
+        cdt = cdts_by_repr.get(this_cdt)
     elif isinstance(this_cdt, FilterSet):
-        for cdt in univariate.cset:
-            if repr(cdt) == repr(this_cdt):
-                found = True
-                break
-    if found:
+        # FilterSet defines no __eq__: try identity before building its repr
+        cdt = cdts_by_id.get(id(this_cdt))
+        if cdt is None:
+            cdt = cdts_by_repr.get(repr(this_cdt))
+    else:
+        cdt = None
+    if cdt is not None:
         cdt_list.append(cdt)
     return
 
@@ -97,7 +109,7 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
                   variance_fractional_pad=.1,
                   show_legend=True,
                   show_cdt_details_in_legend=False,
-                  use_obs_name=None,
+                  use_obs_name=None, timelabel=None,
                   save=False, user_path=None, ext='.png',
                   verbose=False):
     """Plot one point statistics: counts, average, abd variance.
@@ -147,6 +159,10 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
     use_obs_name : str (default None)
         when filled, the plot title will use this observable name instead
         of looking for the observable registered name
+    timelabel : str (default None)
+        time axis label (e.g. 'Time (minutes)'); when None, it is computed
+        from the observable. Pass it to avoid recomputing it when plotting
+        many observables sharing the same time axis
     save : bool {False, True}
         whether to save plot
     user_path : str (default None)
@@ -159,22 +175,25 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
     if not isinstance(univariate, Univariate):
         raise TypeError('Input is not {}'.format(Univariate))
 
-    fig, axs = plt.subplots(3, 1, figsize=(axe_xsize, 3*axe_ysize))
-
     obs = univariate.obs
-    timelabel = _set_timelabel(obs)  # define time label
-
-    main_handles = []  # main legend
-    ci_handles = []  # additional legend (TODO: check if necessary)
-
-    all_times = []
-    all_counts = []
-    all_average = []
-    all_variance = []
+    if timelabel is None:
+        timelabel = _set_timelabel(obs)  # define time label
 
     # build condition list
     conditions = _set_condition_list(univariate, show_cdts)
 
+    fig, axs = plt.subplots(3, 1, figsize=(axe_xsize, 3*axe_ysize))
+
+    main_handles = []  # main legend
+    main_labels = []  # labels of main_handles, in the same order
+    first_ci = None  # first C.I. band, used as legend handle
+
+    # (min, max) of plotted values, to set axis limits
+    time_bounds = ()
+    counts_bounds = ()
+    average_bounds = ()
+    variance_bounds = ()
+
     for index, cdt in enumerate(conditions):
 
         if cdt == 'master':
@@ -193,32 +212,41 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
             alpha = .8
             alpha_fill = 0.3
 
-        ok = np.where(univariate[c_repr].count_one > 0)
-
-        times = univariate[c_repr].time[ok]
-        all_times.extend(times)
-        counts = univariate[c_repr].count_one[ok]
-        all_counts.extend(counts)
-        mean = univariate[c_repr].average[ok]
-        all_average.extend(mean)
-        var = univariate[c_repr].var[ok]
-        all_variance.extend(var)
-        std = univariate[c_repr].std[ok]
-        se = 2.58 * std / np.sqrt(counts)  # standard error 99% CI Gaussian
-#        var = np.diagonal(univariate[c_repr].autocorr)
-
+        univc = univariate[c_repr]
+        count_one = univc.count_one
+        ok = count_one > 0  # boolean mask, applied to each array
+
+        times = univc.time[ok]
+        time_bounds = _update_bounds(time_bounds, times)
+        counts = count_one[ok]
+        counts_bounds = _update_bounds(counts_bounds, counts)
+        mean = univc.average[ok]
+        average_bounds = _update_bounds(average_bounds, mean)
+        var = univc.var[ok]
+        variance_bounds = _update_bounds(variance_bounds, var)
+#        var = np.diagonal(univc.autocorr)
+
+        line_label = '{}'.format(c_label)
         line_counts, = axs[0].plot(times, counts, alpha=alpha, lw=lw,
-                               label='{}'.format(c_label))
+                                   label=line_label)
         main_handles.append(line_counts)
+        main_labels.append(line_label)
         color = line_counts.get_color()
 
         average, = axs[1].plot(times, mean, color=color, alpha=0.8, lw=lw, label=c_label)
         if show_ci:
-            fill_std = axs[1].fill_between(times, mean-se, mean+se,
+            # standard error 99% CI Gaussian: 2.58 * std / sqrt(counts)
+            se = np.sqrt(var)  # std, same as univc.std[ok]
+            se *= 2.58
+            se /= np.sqrt(counts)
+            lower = mean - se
+            upper = mean + se
+            fill_std = axs[1].fill_between(times, lower, upper,
                                            facecolor=color, alpha=alpha_fill)
-            ci_handles.append(fill_std)
-            all_average.extend(mean-se)
-            all_average.extend(mean+se)
+            if first_ci is None:
+                first_ci = fill_std
+            average_bounds = _update_bounds(average_bounds, lower)
+            average_bounds = _update_bounds(average_bounds, upper)
 
         variance, = axs[2].plot(times, var, color=color, alpha=0.8, lw=lw, label=c_label)
 
@@ -227,15 +255,16 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
         mref = axs[1].axhline(mean_ref, ls='-.', color='C7', alpha=.7,
                                label='reference value')
         main_handles.append(mref)
-        all_average.append(mean_ref)
+        main_labels.append('reference value')
+        average_bounds = _update_bounds(average_bounds, mean_ref)
     if var_ref is not None:
         vref = axs[2].axhline(var_ref, ls='-.', color='C7', alpha=.7,
                               label='reference value')
-        # check last label if meanèref has been saved
-        last_lab = main_handles[-1].get_label()
-        if last_lab != vref.get_label():
+        # check last label if mean_ref has been saved
+        if not main_labels or main_labels[-1] != 'reference value':
             main_handles.append(vref)
-        all_variance.append(var_ref)
+            main_labels.append('reference value')
+        variance_bounds = _update_bounds(variance_bounds, var_ref)
 
     # print vertical line at tref
     if obs.timing != 'g' and isinstance(obs.tref, float):
@@ -243,11 +272,12 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
             vtref = ax.axvline(univariate.obs.tref, color='C7', ls='--',
                                 alpha=.5, label='reference time in obs')
         main_handles.append(vtref)  # only the last one
+        main_labels.append('reference time in obs')
 
     # ## limits and ticks ##
     # xaxis
     for ax in axs:
-        left, right = _set_axis_limits(ax, all_times, which='x', pad=time_fractional_pad,
+        left, right = _set_axis_limits(ax, time_bounds, which='x', pad=time_fractional_pad,
                                        force_range=time_range)
     # locator
     locator = _set_time_axis_ticks(axs[0], obs, bounds=(left, right))
@@ -255,27 +285,19 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
         ax.xaxis.set_major_locator(locator)
 
     # yaxis limits
-    _set_axis_limits(axs[0], all_counts, which='y', pad=counts_fractional_pad,
+    _set_axis_limits(axs[0], counts_bounds, which='y', pad=counts_fractional_pad,
                      force_range=counts_range)
     axs[0].yaxis.set_major_locator(ticker.MaxNLocator(nbins=3, integer=True))
     # average
-    _set_axis_limits(axs[1], all_average, which='y', pad=average_fractional_pad,
+    _set_axis_limits(axs[1], average_bounds, which='y', pad=average_fractional_pad,
                      force_range=average_range)
     axs[1].yaxis.set_major_locator(ticker.MaxNLocator(nbins=3))
     # variance
-    _set_axis_limits(axs[2], all_variance, which='y', pad=variance_fractional_pad,
+    _set_axis_limits(axs[2], variance_bounds, which='y', pad=variance_fractional_pad,
                      force_range=variance_range)
     axs[2].yaxis.set_major_locator(ticker.MaxNLocator(nbins=3))
     # tick formatter
-    formatter = ticker.ScalarFormatter(useMathText=True, useOffset=False)
-    formatter.set_powerlimits((-2, 4))
-    for ax in axs:
-        ax.yaxis.set_major_formatter(formatter)
-        t = ax.yaxis.get_offset_text()
-        plt.draw()
-        msg = t.get_text()
-        ax.text(0, .95, msg, ha='left', va='top', transform=ax.transAxes)
-        t.set_visible(False)
+    _set_offset_texts(axs)
 
     axs[0].tick_params(axis='x', direction='in', bottom='on', labelbottom='on', pad=-10)
     axs[1].tick_params(axis='x', direction='in', bottom='on', labelbottom='on', pad=-10)
@@ -295,17 +317,15 @@ def plot_onepoint(univariate, show_cdts='all', show_ci=False,
 
     # ## legend ##
     # C.I.
-    if ci_handles:
-        ci = ci_handles[0]
-#        ci.set_color('C7')
-        ci.set_label('.99 C.I.')
-        main_handles.append(ci)
+    if first_ci is not None:
+#        first_ci.set_color('C7')
+        first_ci.set_label('.99 C.I.')
+        main_handles.append(first_ci)
+        main_labels.append('.99 C.I.')
 
-    handles = main_handles[:]
-    labels = [h.get_label() for h in handles]
     if show_legend:
-        axs[-1].legend(handles=handles, labels=labels, loc='upper left',
-                       bbox_to_anchor=(0, -.5/axe_ysize))
+        axs[-1].legend(handles=main_handles, labels=main_labels,
+                       loc='upper left', bbox_to_anchor=(0, -.5/axe_ysize))
 
     # title
     latex_obs = obs.latexify(use_name=use_obs_name)
@@ -346,7 +366,7 @@ def plot_twopoints(univariate, condition_label=None, trefs=[], ntrefs=4,
                    show_exp_decay=None,
                    show_legend=True,
                    show_cdt_details_in_legend=False,
-                   use_obs_name=None,
+                   use_obs_name=None, timelabel=None,
                    save=False, ext='.png', verbose=False):
     """Plot two-point functions: counts and autocorrelation functions.
 
@@ -393,14 +413,22 @@ def plot_twopoints(univariate, condition_label=None, trefs=[], ntrefs=4,
     use_obs_name : str (default None)
         when filled, the plot title will use this observable name instead
         of looking for the observable registered name
+    timelabel : str (default None)
+        time axis label (e.g. 'Time (minutes)'); when None, it is computed
+        from the observable. Pass it to avoid recomputing it when plotting
+        many observables sharing the same time axis
     save : bool {False, True}
         whether to save figure at canonical path
     ext : str {'.png', '.pdf'}
         extension to be used when saving figure
     verbose : bool {False, True}
     """
+    if not isinstance(univariate, Univariate):
+        raise TypeError('Input is not {}'.format(Univariate))
+
     obs = univariate.obs
-    timelabel = _set_timelabel(obs)  # define time label
+    if timelabel is None:
+        timelabel = _set_timelabel(obs)  # define time label
     # get priod from eval times
     if len(univariate.eval_times) > 0:
         period = univariate.eval_times[1] - univariate.eval_times[0]
@@ -419,9 +447,10 @@ def plot_twopoints(univariate, condition_label=None, trefs=[], ntrefs=4,
         trefs = times[indices]
         logging.info(trefs)
 
-    all_times = []
-    all_counts = []
-    all_corr = []
+    # (min, max) of plotted values, to set axis limits
+    time_bounds = ()
+    counts_bounds = ()
+    corr_bounds = ()
 
     handles = []
 
@@ -455,54 +484,69 @@ def plot_twopoints(univariate, condition_label=None, trefs=[], ntrefs=4,
         else:
             continue
 
-        times = univariate[c_repr].time
-        counts = univariate[c_repr].count_two
-        corr = univariate[c_repr].autocorr
+        univc = univariate[c_repr]
+        times = univc.time
+        counts = univc.count_two
+        corr = univc.autocorr
         var = np.diagonal(corr)
 
-        valid = counts != 0
+        # closest time index for each tref, searched at once
+        dists = np.abs(times[np.newaxis, :] -
+                       np.asarray(trefs, dtype=float)[:, np.newaxis])
+        closest = np.argmin(dists, axis=1)
+        min_dists = dists[np.arange(len(closest)), closest]
+        # correlation rows of trefs, normalized by variance at tref, at once
+        norm_corrs = corr[closest, :] / var[closest][:, np.newaxis]
 
-        for tref in trefs:
+        for tref, index, min_dist, norm_corr in zip(trefs, closest,
+                                                    min_dists, norm_corrs):
             # this tref may not be in conditioned data (who knows)
-            if np.amin(np.abs(times - tref)) > period:
+            if min_dist > period:
                 continue
-            index = np.argmin(np.abs(times - tref))
             if obs.timing == 'g':
                 lab = '{:d}'.format(tref)
             else:
                 lab = '{:.0f}'.format(tref)
             line_label = r'$ {}_{} = {}$ {} ({})'.format(prefix, latex_ref, lab, units, c_label)
 
-            ok = np.where(counts[index, :] > 0)
-#            if len(ok[0]) == 0:
-#                continue
+            row_counts = counts[index, :]
+            ok = row_counts > 0
+            # no sample for this tref: do not create empty artists
+            if not ok.any():
+                continue
+            ok_times = times[ok]
+            ok_counts = row_counts[ok]
             # time limits
-            all_times.extend(times[ok])
-            dat, = axs[0].plot(times[ok], counts[index, :][ok],
+            time_bounds = _update_bounds(time_bounds, ok_times)
+            dat, = axs[0].plot(ok_times, ok_counts,
                       ls=lt, lw=lw, alpha=alpha, label=line_label)
             handles.append(dat)
-            all_counts.extend(counts[index, :][ok])
+            counts_bounds = _update_bounds(counts_bounds, ok_counts)
             color = dat.get_color()
             axs[0].plot((tref, tref), (0, counts[index, index]),
                         ls=':', color=color)
 
+            # normalized correlation on valid points, shared by both axes
+            valid_row = row_counts != 0
+            valid_times = times[valid_row]
+            valid_corr = norm_corr[valid_row]
+
             axs[1].axhline(0, ls='-', color='C7', alpha=.3)  # thin line at 0
-            dat, = axs[1].plot(times[valid[index, :]],
-                           corr[index, :][valid[index, :]]/var[index],
+            dat, = axs[1].plot(valid_times, valid_corr,
                            ls=lt, lw=lw, alpha=alpha)
-            all_corr.extend(corr[index, :][valid[index, :]]/var[index])
+            corr_bounds = _update_bounds(corr_bounds, valid_corr)
             color = dat.get_color()
 
             axs[1].axvline(tref, ymin=0.1, ymax=0.9, ls=':', color=color)
 
             axs[2].axhline(0, ls='-', color='C7', alpha=.3)  # thin line at 0
-            axs[2].plot(times[valid[index, :]] - tref,
-                    corr[index, :][valid[index, :]]/var[index], ls=lt, lw=lw, alpha=alpha)
+            axs[2].plot(valid_times - tref,
+                    valid_corr, ls=lt, lw=lw, alpha=alpha)
 
     # ## limits and ticks ##
     # xaxis
     for ax in axs[:2]:
-        left, right = _set_axis_limits(ax, all_times, which='x',
+        left, right = _set_axis_limits(ax, time_bounds, which='x',
                                        pad=time_fractional_pad,
                                        force_range=time_range)
         hrange = right - left
@@ -520,23 +564,30 @@ def plot_twopoints(univariate, condition_label=None, trefs=[], ntrefs=4,
         tt = np.linspace(left, right, 100)
         dd = np.linspace(-hrange, hrange, 100)
         lab = r'$t_{{\mathrm{{decay}}}} = {:.1f}$ {}'.format(1./show_exp_decay, units)
-        for tref in trefs:
-            axs[1].plot(tt, np.exp(-show_exp_decay * np.abs(tt - tref)),
-                        ls='-.', color='C7', alpha=.7)
-        dec, = axs[2].plot(dd, np.exp(-show_exp_decay * np.abs(dd)),
+        # one decay curve per tref (as columns), computed at once, in place
+        decays = np.subtract.outer(tt, np.asarray(trefs, dtype=float))
+        np.abs(decays, out=decays)
+        decays *= -show_exp_decay
+        np.exp(decays, out=decays)
+        axs[1].plot(tt, decays, ls='-.', color='C7', alpha=.7)
+        # decay as a function of time interval, computed once
+        dd_decay = np.abs(dd)
+        dd_decay *= -show_exp_decay
+        np.exp(dd_decay, out=dd_decay)
+        dec, = axs[2].plot(dd, dd_decay,
                     ls='-.', color='C7', alpha=.7, label=lab)
-        all_corr.extend(np.exp(-show_exp_decay * np.abs(dd)))
+        corr_bounds = _update_bounds(corr_bounds, dd_decay)
         handles.append(dec)
 
     # ## yaxis limits ##
     # counts
-    _set_axis_limits(axs[0], all_counts, which='y', pad=counts_fractional_pad,
+    _set_axis_limits(axs[0], counts_bounds, which='y', pad=counts_fractional_pad,
                      force_range=counts_range)
     axs[0].yaxis.set_major_locator(ticker.MaxNLocator(nbins=3, integer=True))
 
     # corr
     for ax in axs[1:]:
-        _set_axis_limits(ax, all_corr, which='y', pad=corr_fractional_pad,
+        _set_axis_limits(ax, corr_bounds, which='y', pad=corr_fractional_pad,
                          force_range=corr_range)
         ax.yaxis.set_major_locator(ticker.MaxNLocator(nbins=3))
 
@@ -545,15 +596,7 @@ def plot_twopoints(univariate, condition_label=None, trefs=[], ntrefs=4,
     axs[-1].legend(handles=handles, labels=labels, loc='upper left',
                    bbox_to_anchor=(0, -.5/axe_ysize), labelspacing=0.2)  # reduce labelspacing because of LaTeX
 
-    formatter = ticker.ScalarFormatter(useMathText=True, useOffset=False)
-    formatter.set_powerlimits((-2, 4))
-    for ax in axs:
-        ax.yaxis.set_major_formatter(formatter)
-        t = ax.yaxis.get_offset_text()
-        plt.draw()
-        msg = t.get_text()
-        ax.text(0, .95, msg, ha='left', va='top', transform=ax.transAxes)
-        t.set_visible(False)
+    _set_offset_texts(axs)
 
     axs[0].tick_params(axis='x', direction='in', bottom='on', labelbottom='on', pad=-10)
     axs[1].tick_params(axis='x', direction='in', bottom='on', labelbottom='on', pad=-10)
@@ -618,7 +661,7 @@ def plot_stationary(stationary, show_cdts='all',
                     corr_guides=[0., ],
                     show_exp_decay=None,
                     show_legend=True, show_cdt_details_in_legend=False,
-                    use_obs_name=None,
+                    use_obs_name=None, timelabel=None,
                     save=False, ext='.png', verbose=False):
     """Plot stationary autocorrelation.
 
@@ -656,6 +699,9 @@ def plot_stationary(stationary, show_cdts='all',
     use_obs_name : str (default None)
         when filled, the plot title will use this observable name instead
         of looking for the observable registered name
+    timelabel : str (default None)
+        time axis label (e.g. 'Time (minutes)'), to be prefixed by a Delta;
+        when None, it is computed from the observable
     ext : str {'.png', '.pdf'}
         extension used for file
 
@@ -669,12 +715,16 @@ def plot_stationary(stationary, show_cdts='all',
                '{}'.format(StationaryUnivariate) + 'or of '
                '{}'.format(StationaryBivariate))
         raise TypeError(msg)
-    if isinstance(stationary, StationaryUnivariate):
+    # stationary type is resolved once, and branched upon below
+    is_univariate = isinstance(stationary, StationaryUnivariate)
+    if is_univariate:
         obs = stationary.obs
-        timelabel = _set_timelabel(obs, use_tref=False)
-    elif isinstance(stationary, StationaryBivariate):
+        if timelabel is None:
+            timelabel = _set_timelabel(obs, use_tref=False)
+    else:
         obs = [uni.obs for uni in stationary.univariates]
-        timelabel = _set_timelabel(obs[0], use_tref=False)
+        if timelabel is None:
+            timelabel = _set_timelabel(obs[0], use_tref=False)
     if 'minutes' in timelabel:
         units = 'mins'
         prefix = 't'
@@ -690,23 +740,42 @@ def plot_stationary(stationary, show_cdts='all',
     ax2 = fig.add_subplot(gs[1:])
 
     # build condition list
-    if isinstance(stationary, StationaryUnivariate):
+    if is_univariate:
         conditions = _set_condition_list(stationary.univariate, show_cdts=show_cdts)
-    elif isinstance(stationary, StationaryBivariate):
-        conditions = []
+    else:
         conditions_0 = _set_condition_list(stationary.univariates[0], show_cdts=show_cdts)
         conditions_1 = _set_condition_list(stationary.univariates[1], show_cdts=show_cdts)
-        # intersect
-        for cdt in conditions_0:
-            if cdt in conditions_1:
-                conditions.append(cdt)
-
-    all_times = []
-    all_counts = []
-    all_corrs = []
+        # intersect, matching conditions by repr as data is stored by repr
+        reprs_1 = set(repr(cdt) for cdt in conditions_1)
+        conditions = [cdt for cdt in conditions_0 if repr(cdt) in reprs_1]
+
+    # (min, max) of plotted values, to set axis limits; only tracked when
+    # the axis range is not fully forced by user (nor in log scale)
+    time_bounds = ()
+    counts_bounds = ()
+    corr_bounds = ()
+    track_time = None in time_range
+    track_counts = not counts_logscale and None in counts_range
+    track_corr = not corr_logscale and None in corr_range
+
+    # correlation column, and cross-correlation norms: product of standard
+    # deviations, per condition
+    std_prods = {}
+    if is_univariate:
+        corr_key = 'auto_correlation'
+    else:
+        corr_key = 'cross_correlation'
+        for cdt in conditions:
+            c_repr = 'master' if cdt == 'master' else repr(cdt)
+            prod = 1.
+            for single in stationary.univariates:
+                prod *= np.sqrt(single[c_repr].stationary.autocorr[0])
+            std_prods[c_repr] = prod
 
     main_handles = []  # for legend
-    ci_handles = []
+    # C.I. bands of all conditions are drawn as a single collection
+    ci_polygons = []
+    ci_colors = []
 
     for index, cdt in enumerate(conditions):
 
@@ -727,19 +796,19 @@ def plot_stationary(stationary, show_cdts='all',
             alpha_fill = 0.3
 
         array = stationary[c_repr].array
-        nonzero = np.where(array['counts'] > 1)  # 1 sample does not have std
-        dts = array['time_interval'][nonzero]
-        all_times.extend(dts)
-        counts = array['counts'][nonzero]
-        all_counts.extend(counts)
-
-        if isinstance(stationary, StationaryUnivariate):
-            corr = array['auto_correlation'][nonzero]
+        # 1 sample does not have std; compact records once, then read fields
+        sub = array[array['counts'] > 1]
+        dts = sub['time_interval']
+        counts = sub['counts']
+        if track_time:
+            time_bounds = _update_bounds(time_bounds, dts)
+        if track_counts:
+            counts_bounds = _update_bounds(counts_bounds, counts)
+
+        corr = sub[corr_key]
+        if 'std_dev' in array.dtype.names:
+            dev = sub['std_dev']
         else:
-            corr = array['cross_correlation'][nonzero]
-        try:
-            dev = array['std_dev'][nonzero]
-        except ValueError:
             dev = None
 
         # counts
@@ -749,25 +818,39 @@ def plot_stationary(stationary, show_cdts='all',
         col = line.get_color()  # usefule for later stage
 
         # autocorrelation: divide by variance
-        if isinstance(stationary, StationaryUnivariate):
+        if is_univariate:
             norm = corr[0]
         # cross-correlation: divide covariance by product of standard devs
-        elif isinstance(stationary, StationaryBivariate):
-            prod = 1.
-            for single in stationary.univariates:
-                prod *= np.sqrt(single[c_repr].stationary.autocorr[0])
-            norm = prod
-        dat, = ax2.plot(dts, corr/norm, color=col,
+        else:
+            norm = std_prods[c_repr]
+        # normalized arrays are computed once, for plotting and bounds
+        inv_norm = 1. / norm
+        norm_corr = corr * inv_norm
+        dat, = ax2.plot(dts, norm_corr, color=col,
                        lw=lw, alpha=alpha, label=label)
-        all_corrs.extend(corr/norm)
+        if track_corr:
+            corr_bounds = _update_bounds(corr_bounds, norm_corr)
         if dev is not None:
-            se = 2.58 * dev / np.sqrt(counts)
-            ci = ax2.fill_between(dts, (corr-se)/norm, (corr+se)/norm,
-                                      facecolor=col, alpha=alpha_fill,
-                                      label='.99 C.I.')
-            ci_handles.append(ci)
-            all_corrs.extend((corr-se)/norm)
-            all_corrs.extend((corr+se)/norm)
+            # normalized standard error 99% CI Gaussian: 2.58 * dev / sqrt(counts)
+            se = np.sqrt(counts)
+            np.reciprocal(se, out=se)
+            se *= 2.58 * inv_norm
+            se *= dev
+            lower = norm_corr - se
+            upper = np.add(norm_corr, se, out=se)  # se buffer is reused
+            polygons = _band_polygons(dts, lower, upper)
+            ci_polygons.extend(polygons)
+            ci_colors.extend([mpl.colors.to_rgba(col, alpha_fill)] * len(polygons))
+            if track_corr:
+                corr_bounds = _update_bounds(corr_bounds, lower)
+                corr_bounds = _update_bounds(corr_bounds, upper)
+
+    if ci_polygons:
+        ci = PolyCollection(ci_polygons, facecolors=ci_colors,
+                            label='.99 C.I.')
+        ax2.add_collection(ci)
+    else:
+        ci = None
 
     # vertical lines for timing
     for val in time_guides:
@@ -778,7 +861,7 @@ def plot_stationary(stationary, show_cdts='all',
     # ## limits and ticks ##
     # xaxis
     for ax in [ax1, ax2]:
-        left, right = _set_axis_limits(ax, all_times, which='x',
+        left, right = _set_axis_limits(ax, time_bounds, which='x',
                                        pad=time_fractional_pad,
                                        force_range=time_range)
         ax.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
@@ -793,25 +876,19 @@ def plot_stationary(stationary, show_cdts='all',
 
     # ## yaxis limits ##
     # counts
-    formatter = ticker.ScalarFormatter(useMathText=True, useOffset=False)
-    formatter.set_powerlimits((-2, 4))
+    linear_axes = []  # axes to print offset text for
     if not counts_logscale:
-        _set_axis_limits(ax1, all_counts, which='y', pad=counts_fractional_pad,
+        _set_axis_limits(ax1, counts_bounds, which='y', pad=counts_fractional_pad,
                          force_range=counts_range)
         ax1.yaxis.set_major_locator(ticker.MaxNLocator(nbins=3, integer=True))
-        ax1.yaxis.set_major_formatter(formatter)
-        t = ax.yaxis.get_offset_text()
-        plt.draw()
-        msg = t.get_text()
-        ax1.text(0, .95, msg, ha='left', va='top', transform=ax.transAxes)
-        t.set_visible(False)
+        linear_axes.append(ax1)
     else:
         ax1.set_yscale('symlog', linthresh=1)
 
     # corr
 
     if not corr_logscale:
-        bottom, top = _set_axis_limits(ax2, all_corrs, which='y',
+        bottom, top = _set_axis_limits(ax2, corr_bounds, which='y',
                                        pad=corr_fractional_pad,
                                        force_range=corr_range)
         if top > 2 or bottom < -2:
@@ -819,17 +896,13 @@ def plot_stationary(stationary, show_cdts='all',
         else:
             locator = ticker.FixedLocator([-1, -.5, 0., .5, 1])
         ax2.yaxis.set_major_locator(locator)
-        ax2.yaxis.set_major_formatter(formatter)
-        t = ax.yaxis.get_offset_text()
-        plt.draw()
-        msg = t.get_text()
-        ax2.text(0, .95, msg, ha='left', va='top', transform=ax.transAxes)
-        t.set_visible(False)
+        linear_axes.append(ax2)
     else:
         ax2.set_yscale('symlog', linthreshy=0.1, linscaley=0.2,
                        subsy=[2, 3, 4, 5, 6, 7, 8, 9])
         if corr_range[0] is not None and corr_range[0] > 0.:
             ax2.set_ylim(bottom=corr_range[0])
+    _set_offset_texts(linear_axes)
 
     ax1.tick_params(axis='x', direction='in', bottom='on', labelbottom='on', pad=-10)
     ax2.set_xlabel(timelabel, x=.95, horizontalalignment='right',
@@ -842,14 +915,14 @@ def plot_stationary(stationary, show_cdts='all',
 
     # ylabels
     ax1.set_ylabel(r'Counts', fontsize='medium')
-    if isinstance(stationary, StationaryUnivariate):
+    if is_univariate:
         ax2.set_ylabel(r'$\tilde{{a}}(\Delta {})$'.format(prefix), fontsize='medium')
-    elif isinstance(stationary, StationaryBivariate):
+    else:
         ax2.set_ylabel(r'$\tilde{{c}}(\Delta {})$'.format(prefix), fontsize='medium')
 
     # writting observable
     # case: obs is a single observable
-    if isinstance(stationary, StationaryUnivariate):
+    if is_univariate:
         msg = '{}:{}'.format(obs.latexify(shorten_time_variable=True, use_name=use_obs_name),
                              obs.latexify(plus_delta=True, shorten_time_variable=True, use_name=use_obs_name))
     # case: obs is a couple of observables
@@ -881,10 +954,7 @@ def plot_stationary(stationary, show_cdts='all',
 
     # ## legend ##
     # C.I.
-    if ci_handles:
-        ci = ci_handles[0]
-        # ci.set_color('C7')
-        ci.set_label('.99 C.I.')
+    if ci is not None:
         main_handles.append(ci)
 
     handles = main_handles[:]
@@ -3,7 +3,10 @@
 """
 Helper functions for plotting modules
 """
-import collections
+try:
+    from collections.abc import Iterable  # python3
+except ImportError:
+    from collections import Iterable  # python2
 
 import numpy as np
 from matplotlib import ticker
@@ -35,14 +38,17 @@ def _set_axis_limits(ax, values, which='x', pad=.1, force_range=(None, None)):
     ValueError
         when which is not 'x' or 'y'
     """
-    if len(values) == 0:
-        lower, upper = -1, 1  # default
+    if force_range[0] is not None and force_range[1] is not None:
+        lower, upper = force_range  # no need to look at values
     else:
-        lower, upper = np.nanmin(values), np.nanmax(values)
-    if force_range[0] is not None:
-        lower = force_range[0]
-    if force_range[1] is not None:
-        upper = force_range[1]
+        if len(values) == 0:
+            lower, upper = -1, 1  # default
+        else:
+            lower, upper = np.nanmin(values), np.nanmax(values)
+        if force_range[0] is not None:
+            lower = force_range[0]
+        if force_range[1] is not None:
+            upper = force_range[1]
     if lower == upper:
         vrange = .1 * upper  # 10% of unique value
     else:
@@ -58,6 +64,83 @@ def _set_axis_limits(ax, values, which='x', pad=.1, force_range=(None, None)):
     return lower, upper
 
 
+def _update_bounds(bounds, values):
+    """Updates (lower, upper) bounds with values, ignoring NaNs.
+
+    Parameters
+    ----------
+    bounds : couple of floats, or empty tuple
+        current bounds; empty tuple when no value has been seen yet
+    values : iterable/list of ints/floats
+
+    Returns
+    -------
+    couple of floats, or empty tuple
+        bounds are returned unchanged when values is empty; the result can be
+        passed as values to :func:`_set_axis_limits`
+    """
+    values = np.ravel(values)
+    if len(values) == 0:
+        return bounds
+    lower, upper = np.fmin.reduce(values), np.fmax.reduce(values)
+    if bounds:
+        lower = np.fmin(bounds[0], lower)
+        upper = np.fmax(bounds[1], upper)
+    return lower, upper
+
+
+def _band_polygons(x, lower, upper):
+    """Computes vertices of polygons filling the band between lower and upper.
+
+    As in Axes.fill_between, points where any value is not finite are left
+    out and split the band into several polygons.
+
+    Parameters
+    ----------
+    x : 1d array of floats
+    lower : 1d array of floats
+        lower boundary of the band, evaluated at x
+    upper : 1d array of floats
+        upper boundary of the band, evaluated at x
+
+    Returns
+    -------
+    list of (N, 2) arrays
+        vertices of each polygon, to be passed to a PolyCollection
+    """
+    valid = np.isfinite(x) & np.isfinite(lower) & np.isfinite(upper)
+    # start (even entries) and stop (odd entries) of contiguous valid regions
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], valid.view(np.int8), [0]))))
+    polygons = []
+    for start, stop in zip(edges[::2], edges[1::2]):
+        xs = x[start:stop]
+        polygons.append(np.concatenate((np.column_stack((xs, lower[start:stop])),
+                                        np.column_stack((xs, upper[start:stop]))[::-1])))
+    return polygons
+
+
+def _set_offset_texts(axes):
+    """Prints y-axis offset text in upper left corner of each axes.
+
+    Each axes gets its own ScalarFormatter, since the offset depends on the
+    axis range. The offset is computed from the major tick locations, which
+    avoids drawing the figure: axis limits must be set beforehand.
+
+    Parameters
+    ----------
+    axes : list of Axes instances
+    """
+    for ax in axes:
+        formatter = ticker.ScalarFormatter(useMathText=True, useOffset=False)
+        formatter.set_powerlimits((-2, 4))
+        ax.yaxis.set_major_formatter(formatter)
+        formatter.set_locs(ax.yaxis.get_majorticklocs())
+        msg = formatter.get_offset()
+        ax.text(0, .95, msg, ha='left', va='top', transform=ax.transAxes)
+        ax.yaxis.get_offset_text().set_visible(False)
+    return
+
+
 def _set_time_axis_ticks(ax, obs, bounds=(None, None)):
     """Set ticker options for time axis
     
@@ -127,7 +210,7 @@ def _unroll_samples(arg):
     elif isinstance(arg, Colony):
         for lin in arg.iter_lineages():
             yield lin
-    elif isinstance(arg, collections.Iterable):
+    elif isinstance(arg, Iterable):
         for item in arg:
             for elem in _unroll_samples(item):
                 yield elem
\ No newline at end of file
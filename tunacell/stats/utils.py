@@ -10,17 +10,22 @@ import os
 import logging
 import string
 import csv
+import itertools
+import contextlib
 import numpy as np
 from tqdm import tqdm
 
 from tunacell.base.parser import Parser
 from tunacell.base.experiment import Experiment
+from tunacell.base.datatools import nanminmax
 from tunacell.io import text
 from tunacell.base.observable import set_observable_list
 
 
 logger = logging.getLogger(__name__)
 
+_UPPER = string.ascii_uppercase
+
 
 def iter_timeseries_(exp, observable, conditions, size=None):
     """Iterator over :class:`TimeSeries` instances from lineages in exp.
@@ -81,12 +86,11 @@ def iter_timeseries_2(exp, obs1, obs2, conditions, size=None):
         exp.count_items()
     n_lineages = exp._counts['lineages']
     for lineage in tqdm(exp.iter_lineages(size=size), total=n_lineages, desc='sample iteration'):
-        ts1 = lineage.get_timeseries(obs1,
-                                     raw_obs=raw_obs, func_obs=func_obs,
-                                     cset=conditions)
-        ts2 = lineage.get_timeseries(obs2,
-                                     raw_obs=raw_obs, func_obs=func_obs,
-                                     cset=conditions)
+        # cells are built and tested once for both observables
+        ts1, ts2 = lineage.get_timeseries_many([obs1, obs2],
+                                               raw_obs=raw_obs,
+                                               func_obs=func_obs,
+                                               cset=conditions)
         yield (ts1, ts2)
 
 
@@ -94,6 +98,12 @@ class CompuParamsError(ValueError):
     pass
 
 
+# string codes of (adjust_mean, disjoint) computation options
+_COMPU_CODES = {('global', False): 'g', ('global', True): 'gd',
+                ('local', False): 'l', ('local', True): 'ld'}
+_COMPU_PARAMS = dict((code, key) for key, code in _COMPU_CODES.items())
+
+
 class CompuParams(object):
     """Options for the computation of statistics under stationary hypothesis
     """
@@ -107,27 +117,15 @@ class CompuParams(object):
         self.disjoint = disjoint
 
     def as_string_code(self):
-        code = ''
-        code += self.adjust_mean[0]
-        if self.disjoint:
-            code += 'd'
-        return code
+        return _COMPU_CODES[(self.adjust_mean, self.disjoint)]
 
     def load_from_string_code(self, code):
         if not isinstance(code, str):
             raise CompuParamsError('argument must be a string')
-        if code[0] == 'g':
-            self.adjust_mean = 'global'
-        elif code[0] == 'l':
-            self.adjust_mean = 'local'
-        else:
-            raise CompuParamsError('adjust_mean not valid in {}'.format(code))
-        self.disjoint = False
-        if len(code) > 1:
-            if code[1] == 'd':
-                self.disjoint = True
-            else:
-                raise CompuParamsError('string {} not valid'.format(code))
+        try:
+            self.adjust_mean, self.disjoint = _COMPU_PARAMS[code]
+        except KeyError:
+            raise CompuParamsError('string {} not valid'.format(code))
 
 
 class RegionsIOError(IOError):
@@ -138,6 +136,20 @@ class UndefinedRegion(ValueError):
     pass
 
 
+def _parse_num(value):
+    """Converts a string to int when possible, to float otherwise
+
+    Raises
+    ------
+    ValueError
+        when string does not represent a number
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
 class Region(object):
     """Minimal object that store region parameters
 
@@ -151,14 +163,16 @@ class Region(object):
         upper bound for acquisition time values
     """
 
+    __slots__ = ('name', 'tmin', 'tmax')
+
     def __init__(self, name=None, tmin=None, tmax=None):
         self.name = name
         if isinstance(tmin, str):
-            self.tmin = eval(tmin)  # will evaluate as int or float
+            self.tmin = _parse_num(tmin)  # will evaluate as int or float
         else:
             self.tmin = tmin
         if isinstance(tmax, str):
-            self.tmax = eval(tmax)
+            self.tmax = _parse_num(tmax)
         else:
             self.tmax = tmax
     
@@ -188,6 +202,12 @@ class Regions(object):
         else:
             raise TypeError('first arg must be either Experiment or Parser')
         self._regions = {}  # dictionary name: region
+        self._names_by_bounds = {}  # dictionary (tmin, tmax): name
+        self._text_file = None  # path to regions file, resolved once
+        self._folder_ready = False  # whether analysis folder was created
+        self._deferred = False  # when True, saving is postponed
+        # index of the next candidate name, see _find_available_name
+        self._next_label_index = 0
         try:
             self.load()
             _all = self.get('ALL')
@@ -212,33 +232,75 @@ class Regions(object):
         return msg
 
     def _path_to_file(self, write=False):
-        analysis_path = text.get_analysis_path(self.exp, write=write)
-        text_file = os.path.join(analysis_path, 'regions.tsv')
-        if not os.path.exists(text_file) and not write:
+        # analysis folder is resolved (and created) once, not on every save
+        if (write and self._folder_ready and
+                not os.path.isdir(os.path.dirname(self._text_file))):
+            self._folder_ready = False  # folder was removed since: create it
+        if self._text_file is None or (write and not self._folder_ready):
+            analysis_path = text.get_analysis_path(self.exp, write=write)
+            self._text_file = os.path.join(analysis_path, 'regions.tsv')
+            if write:
+                self._folder_ready = True
+        text_file = self._text_file
+        if not write and not os.path.exists(text_file):
             raise RegionsIOError
         return text_file
 
     def load(self):
         text_file = self._path_to_file(write=False)
         with open(text_file, 'r') as f:
-            items = csv.DictReader(f, delimiter='\t')
-            for item in items:  # item is a dict with keys name, tmin, tmax
-                name = item['name']
-                self._regions[name] = item
+            reader = csv.reader(f, delimiter='\t')
+            header = next(reader)
+            iname = header.index('name')
+            itmin = header.index('tmin')
+            itmax = header.index('tmax')
+            for row in reader:
+                name = row[iname]
+                # convert bounds once, as they are compared to numbers
+                self._regions[name] = {'name': name,
+                                       'tmin': _parse_num(row[itmin]),
+                                       'tmax': _parse_num(row[itmax])}
+        self._index_bounds()
+
+    def _index_bounds(self):
+        """Map (tmin, tmax) bounds to region names, first name wins"""
+        index = {}
+        for name, item in self._regions.items():
+            index.setdefault((item['tmin'], item['tmax']), name)
+        self._names_by_bounds = index
 
     def save(self):
+        """Write regions to text file (no-op within :meth:`bulk_update`)"""
+        if self._deferred:
+            return
         if self._regions is not None:
             text_file = self._path_to_file(write=True)
             with open(text_file, 'w') as f:
                 fieldnames = ['name', 'tmin', 'tmax']
                 writer = csv.DictWriter(f, fieldnames, delimiter='\t')
                 writer.writeheader()
-                # sort rows
-                names = sorted(self._regions.keys())
-                for name in names:
-                    item = self._regions[name]
-                    writer.writerow(item)
+                # rows sorted by name
+                writer.writerows(item for _, item in
+                                 sorted(self._regions.items()))
     
+    @contextlib.contextmanager
+    def bulk_update(self):
+        """Context manager that saves regions once, on exit.
+
+        Automatic saving performed by :meth:`add` and :meth:`delete` is
+        suspended within the block, e.g.::
+
+            with regions.bulk_update():
+                for tmin in range(0, 100, 10):
+                    regions.add(tmin=tmin, tmax=tmin + 10)
+        """
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self.save()
+
     def _lookup_bounds(self, tmin=None, tmax=None):
         """Look up in defined regions whether a region already exists
 
@@ -263,11 +325,7 @@ class Regions(object):
                 tmin = left
             if tmax is None:
                 tmax = right
-        name = None
-        for key, item in self._regions.items():
-            if item['tmin'] == tmin and item['tmax'] == tmax:
-                name = item['name']
-                break
+        name = self._names_by_bounds.get((tmin, tmax))
         return name, tmin, tmax
 
     def add(self, region=None, name=None, tmin=None, tmax=None):
@@ -310,12 +368,14 @@ class Regions(object):
                 logger.debug('Region "{}" already exists and match parameters'.format(name))
             else:
                 logger.warning('Region parameters match region "{}" which is used'.format(_name))
-            return self._regions[_name][_name]
+            return _name
         # region does not exists yet
         else:
             # find a name starting with 'A', 'B', ..., 'Z', then 'A1', 'B1', ...
             if name is None:
-                _name = _find_available_name(used_names=self.names)
+                _name, index = _find_available_name(
+                    used_names=self._regions, start=self._next_label_index)
+                self._next_label_index = index + 1
             else:
                 _name = name
             item = {'name': _name, 'tmin': _tmin, 'tmax': _tmax}
@@ -324,7 +384,13 @@ class Regions(object):
                    'tmin: {}'.format(item['tmin']) + ', '
                    'tmax: {}'.format(item['tmax']))
             logger.debug(msg)
+            overwrite = item['name'] in self._regions
             self._regions[item['name']] = item
+            if overwrite:
+                # previous bounds of this name must not be found anymore
+                self._index_bounds()
+            else:
+                self._names_by_bounds[(_tmin, _tmax)] = item['name']
             # automatic saving
             self.save()
             return item['name']
@@ -337,16 +403,22 @@ class Regions(object):
         name : str
             name of the region to delete
         """
-        if name in self.names:
+        if name in self._regions:
             del self._regions[name]
+            # another region may share bounds of deleted region
+            self._index_bounds()
+            # freed name may be reused: probe again from the start
+            self._next_label_index = 0
         self.save()
 
     def reset(self):
         """Delete all regions except 'ALL'"""
-        names = self.names[:]
-        for name in names:
+        for name in list(self._regions):
             if name != 'ALL':
-                self.delete(name)
+                del self._regions[name]
+        self._index_bounds()
+        self._next_label_index = 0
+        self.save()
 
     def get(self, name):
         """Get region parameters corresponding to name
@@ -364,7 +436,7 @@ class Regions(object):
         ------
         :class:`UndefinedRegion` when name is not in the list
         """
-        if name not in self.names:
+        if name not in self._regions:
             raise UndefinedRegion(name)
         item = self._regions[name]
         return Region(**item)
@@ -384,47 +456,53 @@ def _find_time_boundaries(exp):
     tright : float (or int)
         maximum time value in experiment
     """
-    tleft, tright = np.infty, -np.infty
+    # start with infinite bounds, kept when no time value is found
+    tmins, tmaxs = [float('inf')], [float('-inf')]
     logger.debug('Parsing experiment to get min, max values for registered times')
     for container in exp.iter_containers(read=True, build=False):
-        tmin = np.nanmin(container.data['time'])
-        tmax = np.nanmax(container.data['time'])
-        if tmin < tleft:
-            tleft = tmin
-        if tmax > tright:
-            tright = tmax
+        times = container.data['time']
+        if len(times) == 0:
+            continue
+        tmin, tmax = nanminmax(times)
+        tmins.append(tmin)
+        tmaxs.append(tmax)
+    # fmin, fmax ignore NaNs: all-NaN containers leave bounds unchanged
+    # plain floats: bounds are compared to user values in Regions
+    tleft = float(np.fmin.reduce(np.array(tmins, dtype=np.float64)))
+    tright = float(np.fmax.reduce(np.array(tmaxs, dtype=np.float64)))
     logger.debug('Boundaries found: min {} max {}'.format(tleft, tright))
     return tleft, tright
 
 
-def _find_available_name(used_names=[]):
+def _find_available_name(used_names=(), start=0):
     """Find a new name by parsing alphabetical order
 
+    Names are probed in order 'A', ..., 'Z', 'A1', ..., 'Z1', 'A2', ...
+
     Parameters
     ----------
-    used_names : list of str
+    used_names : list of str (or set, or dict with names as keys)
+    start : int (default 0)
+        index of the first name to probe in the sequence above
 
     Returns
     -------
-    str
+    name : str
         new name
+    index : int
+        index of new name in the sequence; callers may pass index + 1 as
+        start of the next search when no name has been freed meanwhile
     """
-    got_it = False
-    num = 0
-    while not got_it:
-        upper = string.ascii_uppercase
-        index = 0
-        while index < 26:
-            if num == 0:
-                letter = upper[index]
-            else:
-                letter = upper[index] + '{}'.format(num)
-            if letter not in used_names:
-                got_it = True
-                break
-            index += 1
-        num += 1
-    return letter
+    used = used_names
+    if not isinstance(used, (set, frozenset, dict)):
+        used = set(used)
+    for k in itertools.count(start):
+        num, idx = divmod(k, 26)
+        letter = _UPPER[idx]
+        if num > 0:
+            letter += '{}'.format(num)
+        if letter not in used:
+            return letter, k
 
 
 def _dtype_converter(col_name):
@@ -94,7 +94,17 @@ def test_cell_division_timing(cells):
     for index in range(1, 10):
         assert cell.birth_time == 3
     
-    
+
+def test_cell_fields_are_views_on_data():
+    cell = Cell(identifier='0')
+    cell.data = np.zeros(3, dtype=[('time', 'f8'), ('length', 'f8')])
+    # in place modification of data is seen through field views
+    cell.data['time'] = [0., 1., 2.]
+    cell.data['length'] = [1., 2., 4.]
+    assert list(cell._time) == [0., 1., 2.]
+    assert list(cell._fields['length']) == [1., 2., 4.]
+
+
 def test_cell_build_filiation(binary_division_cells):
     cells = binary_division_cells
      # make filiation in place
@@ -130,6 +140,15 @@ def test_colony_independent_decomposition(tree):
     assert tree.idseqs == [['harry', 'jane', 'mark'], ['diane', 'mary'], ['bill']]
 
 
+def test_colony_decomposition_global_random_state(tree):
+    np.random.seed(0)
+    expected = np.random.uniform()
+    np.random.seed(0)
+    tree.decompose(independent=True, seed=42)
+    assert np.random.uniform() == expected
+    assert tree._decompositions[(True, 42)] is tree.idseqs
+
+
 def test_colony_recursive_constructor(binary_division_cells):
     """This is effectively used in Container class"""
     cells = binary_division_cells
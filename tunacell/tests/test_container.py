@@ -8,8 +8,12 @@ from __future__ import print_function
 import pytest
 import tunacell
 import os
+import numpy as np
 
+from tunacell.base.cell import Cell
+from tunacell.base.container import infer_period
 from tunacell.base.experiment import Experiment
+from tunacell.base.observable import Observable
 
 path_data = os.path.join(os.path.dirname(tunacell.__file__), 'data')
 path_fake_exp = os.path.join(path_data, 'fake')
@@ -47,3 +51,84 @@ def test_container_content(container):
     assert len(container.trees) == 1
     colony = container.get_colony('2')
     assert colony.root == '1'  # root cell
+
+
+def test_cell_rebuild_after_data_reassignment():
+    exp = Experiment(path_fake_exp)
+    cont = exp.get_container('container_01')
+    cell = cont.get_colony('2').get_node('2')
+    obs = Observable(raw='value')
+    cell.build(obs)
+    before = np.array(cell._sdata[obs.label])
+    new_data = cell.data.copy()
+    new_data['value'] *= 2.
+    cell.data = new_data
+    cell.build(obs)
+    assert np.allclose(cell._sdata[obs.label], 2. * before)
+
+
+def test_period_inferred_when_missing():
+    exp = Experiment(path_fake_exp)
+    cont = exp.get_container('container_01')
+    assert cont._inferred_period is None  # period given in metadata
+    cont.period = None
+    cont.read_data()
+    assert cont.period is None  # metadata value is left untouched
+    assert cont._inferred_period == infer_period(cont.cells)
+    assert cont._inferred_period > 0
+
+
+def _cells_with_empty_one():
+    """Container cells, plus a cell without data whose parent is cell '2'"""
+    exp = Experiment(path_fake_exp)
+    cont = exp.get_container('container_01')
+    cont.period = 5.  # acquisition period of fake data
+    cells = list(cont.cells)
+    parent = [cell for cell in cells if cell.identifier == '2'][0]
+    empty = Cell(identifier='7', container=cont)
+    empty.data = parent.data[:0]
+    empty.parent = parent
+    cells.append(empty)
+    return cells
+
+
+@pytest.mark.parametrize('mode, kwargs', [
+    ('birth', {}),
+    ('division', {}),
+    ('net-increase-additive', {}),
+    ('net-increase-multiplicative', {}),
+    ('average', {}),
+    ('rate', {}),
+    ('rate', {'scale': 'log'}),
+    ('average', {'differentiate': True}),
+    ('birth', {'local_fit': True, 'time_window': 15.}),
+    ])
+def test_build_population_as_cell_build(mode, kwargs):
+    obs = Observable(raw='value', mode=mode, **kwargs)
+    single = _cells_with_empty_one()
+    for cell in single:
+        cell.build(obs)
+    population = _cells_with_empty_one()
+    Cell.build_population(population, obs)
+    assert any(cell.parent is None for cell in population)
+    for one, other in zip(single, population):
+        assert one.identifier == other.identifier
+        assert np.allclose(one._sdata[obs.label], other._sdata[obs.label],
+                           equal_nan=True)
+
+
+def test_equal_observables_share_build_rules():
+    exp = Experiment(path_fake_exp)
+    cont = exp.get_container('container_01')
+    lineage = next(cont.get_colony('2').iter_lineages())
+    obs = Observable(raw='value')
+    same = Observable(raw='value')  # another, identically defined instance
+    ts, ts_same = lineage.get_timeseries_many([obs, same], raw_obs=[obs])
+    assert len(ts.timeseries.y) > 0
+    assert np.array_equal(ts.timeseries.y, ts_same.timeseries.y)
+    # protection applies to identically defined observables
+    cell = lineage.cellseq[0]
+    cell._sdata.pop(obs.label)
+    cell._built_labels.discard(obs.label)
+    cell.build(Observable(raw='value'))
+    assert obs.label not in cell._sdata
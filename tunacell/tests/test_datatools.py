@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_datatools
+"""
+from __future__ import print_function
+
+import pytest
+import numpy as np
+from scipy.interpolate import interp1d
+
+from tunacell.base import datatools
+from tunacell.base.datatools import (segment_nanmeans, segment_slopes,
+                                     nanminmax, _linear_fit, _derivative)
+
+
+@pytest.fixture
+def segments():
+    """Three segments of lengths 4, 0, 3 concatenated"""
+    lengths = np.array([4, 0, 3])
+    x = np.array([0., 1., 2., 3., 10., 12., 14.])
+    y = np.array([1., 3., 5., 7., 2., np.nan, 3.])
+    return x, y, lengths
+
+
+def test_segment_nanmeans(segments):
+    x, y, lengths = segments
+    means = segment_nanmeans(y, lengths)
+    assert means[0] == 4.
+    assert np.isnan(means[1])
+    assert means[2] == 2.5
+
+
+def test_segment_slopes(segments):
+    x, y, lengths = segments
+    slopes = segment_slopes(x, y, lengths)
+    assert np.isclose(slopes[0], np.polyfit(x[:4], y[:4], 1)[0])
+    assert np.isnan(slopes[1])
+    assert np.isnan(slopes[2])  # NaN propagates
+
+
+def test_nanminmax():
+    assert nanminmax(np.array([np.nan, 3., -1., 2.])) == (-1., 3.)
+    assert np.all(np.isnan(nanminmax(np.array([np.nan, np.nan]))))
+
+
+def _per_point_fits(x, y, period, time_window, n_points, x_break):
+    """Reference: one polyfit per window, as computed before vectorization"""
+    fit_x = np.zeros_like(x)
+    fit_y = np.zeros_like(x)
+    rates = np.zeros_like(x)
+    counts = np.zeros(len(x), dtype=int)
+    for index, t in enumerate(x):
+        t_start = t - period/2.
+        t_stop = t_start + time_window
+        time_eval = (t_start + t_stop)/2.
+        fit_x[index] = time_eval
+        boo = np.logical_and(x > t_start, x <= t_stop)
+        counts[index] = np.sum(boo)
+        if t_stop <= x_break or counts[index] < n_points:
+            fit_y[index] = np.nan
+            rates[index] = np.nan
+        else:
+            rate, intercept = np.polyfit(x[boo], y[boo], 1)
+            fit_y[index] = rate * time_eval + intercept
+            rates[index] = rate
+    return fit_x, fit_y, rates, counts
+
+
+def _assert_same_rates(monkeypatch, *args, **kwargs):
+    new = datatools.compute_rates(*args, **kwargs)
+    with monkeypatch.context() as m:
+        m.setattr(datatools, '_sliding_window_fits', _per_point_fits)
+        old = datatools.compute_rates(*args, **kwargs)
+    for new_ar, old_ar in zip(new, old):
+        assert np.allclose(new_ar, old_ar, equal_nan=True)
+    return new
+
+
+def test_compute_rates_with_nans(monkeypatch):
+    x = np.arange(0., 100., 5.)
+    y = np.exp(0.02 * x) * (1. + 0.01 * np.sin(x))
+    y[[3, 4, 11]] = np.nan
+    rates = _assert_same_rates(monkeypatch, x, y, time_window=20.)[0]
+    assert np.any(np.isfinite(rates))
+
+
+def test_compute_rates_short_window(monkeypatch):
+    # windows hold fewer than n_points
+    x = np.array([0., 5., 10., 30., 35., 40., 45.])
+    y = np.exp(0.01 * x)
+    _assert_same_rates(monkeypatch, x, y, time_window=15.)
+    # whole series shorter than the time window
+    x = np.array([0., 5., 10.])
+    rates = _assert_same_rates(monkeypatch, x, np.exp(0.01 * x),
+                               time_window=30.)[0]
+    assert np.all(np.isnan(rates))
+
+
+def test_compute_rates_with_x_break(monkeypatch):
+    anterior_x = np.arange(0., 50., 5.)
+    anterior_y = 2. * np.exp(0.02 * anterior_x)
+    x = np.arange(50., 100., 5.)
+    y = np.exp(0.02 * x) * (1. + 0.01 * np.cos(x))
+    y[2] = np.nan
+    out = _assert_same_rates(monkeypatch, x, y, x_break=47.5,
+                             anterior_x=anterior_x, anterior_y=anterior_y,
+                             time_window=20.)
+    rates, anterior_rates = out[0], out[2]
+    assert np.any(np.isfinite(rates))
+    assert np.any(np.isfinite(anterior_rates))
+
+
+@pytest.mark.parametrize('x, y', [
+    (np.array([0., 1., 2., 3.]), np.array([1., 3., 4., 8.])),
+    (np.array([1e6, 1e6 + 5., 1e6 + 10.]), np.array([2., 2.5, 3.7])),
+    (np.array([3., 5.]), np.array([-1., 4.])),  # length 2: exact line
+    ])
+def test_linear_fit_as_polyfit(x, y):
+    assert np.allclose(_linear_fit(x, y), np.polyfit(x, y, 1))
+
+
+@pytest.mark.parametrize('x, y', [
+    (np.array([2.]), np.array([5.])),
+    (np.array([0.1, 0.1, 0.1]), np.array([1., 2., 3.])),
+    (np.array([]), np.array([])),
+    ])
+def test_linear_fit_degenerate(x, y):
+    slope, intercept = _linear_fit(x, y)
+    assert np.isnan(slope)
+    assert np.isnan(intercept)
+
+
+def _interp1d_derivative(x, y):
+    """Reference: finite differences interpolated with scipy interp1d"""
+    out = np.full(len(x), np.nan)
+    valid = np.logical_not(np.logical_or(np.isnan(x), np.isnan(y)))
+    clear_x, clear_y = x[valid], y[valid]
+    if len(clear_x) < 3:
+        return out
+    f = interp1d((clear_x[1:] + clear_x[:-1])/2.,
+                 np.diff(clear_y)/np.diff(clear_x),
+                 kind='linear', assume_sorted=True, bounds_error=False)
+    out[valid] = f(clear_x)
+    return out
+
+
+@pytest.mark.parametrize('x, y', [
+    (np.arange(0., 50., 5.), np.exp(0.03 * np.arange(0., 50., 5.))),
+    (np.array([0., 5., 10., 15., 20.]), np.array([1., np.nan, 2., 4., 3.])),
+    (np.array([0., 5., 10.]), np.array([1., 2., 4.])),
+    (np.array([0., 5.]), np.array([1., 2.])),
+    (np.array([0.]), np.array([1.])),
+    (np.array([0., 5., 10.]), np.array([np.nan, 2., np.nan])),
+    ])
+def test_derivative_as_interp1d(x, y):
+    assert np.allclose(_derivative(x, y), _interp1d_derivative(x, y),
+                       equal_nan=True)
+
+
+def test_derivative_short_series():
+    for n in range(3):
+        x = np.arange(float(n))
+        assert np.all(np.isnan(_derivative(x, x)))
+        assert len(_derivative(x, x)) == n
+
+
+def test_derivative_constant_x():
+    with np.errstate(divide='ignore'):
+        out = _derivative(np.full(4, 2.), np.array([1., 2., 3., 4.]))
+    assert not np.any(np.isfinite(out))
@@ -12,6 +12,7 @@ import shutil
 import tunacell
 from tunacell.base.experiment import Experiment
 from tunacell.base.container import Container
+from tunacell.stats.utils import Regions
 
 path_data = os.path.join(os.path.dirname(tunacell.__file__), 'data')
 path_fake_exp = os.path.join(path_data, 'fake')
@@ -76,3 +77,82 @@ def test_counts(fake_exp):
     assert counts['cells'] == 18
     assert counts['colonies'] == 3
     assert counts['lineages'] == 9  # number of leaves when no filter is applied
+
+
+def test_regions_overwritten_name_releases_bounds(fake_exp):
+    regions = Regions(fake_exp)
+    assert regions.add(name='A', tmin=0, tmax=10) == 'A'
+    assert regions.add(name='A', tmin=5, tmax=15) == 'A'
+    # (0, 10) is not used anymore: a new region is created
+    name = regions.add(tmin=0, tmax=10)
+    assert name != 'A'
+    assert regions.get(name).tmin == 0
+    assert regions.get(name).tmax == 10
+    assert regions.get('A').tmin == 5
+    regions.reset()
+
+
+def test_regions_save_after_analysis_folder_removal(fake_exp):
+    regions = Regions(fake_exp)
+    regions.add(name='A', tmin=0, tmax=10)
+    analysis_path = os.path.join(path_fake_exp, 'analysis')
+    shutil.rmtree(analysis_path)
+    regions.add(name='B', tmin=0, tmax=20)  # folder is created again
+    assert os.path.exists(os.path.join(analysis_path, 'regions.tsv'))
+    assert Regions(fake_exp).get('B').tmax == 20
+    regions.reset()
+
+
+def _count_writes(monkeypatch):
+    """Counts files opened for writing by tunacell.stats.utils"""
+    from tunacell.stats import utils
+    writes = []
+
+    def counting_open(path, mode='r', *args, **kwargs):
+        if 'w' in mode:
+            writes.append(path)
+        return open(path, mode, *args, **kwargs)
+    monkeypatch.setattr(utils, 'open', counting_open, raising=False)
+    return writes
+
+
+def test_regions_bulk_update_writes_once(fake_exp, monkeypatch):
+    regions = Regions(fake_exp)
+    regions.reset()
+    writes = _count_writes(monkeypatch)
+    with regions.bulk_update():
+        for tmin in range(0, 50, 10):
+            regions.add(tmin=tmin, tmax=tmin + 10)
+        regions.delete('A')
+    assert len(writes) == 1
+    assert sorted(Regions(fake_exp).names) == ['ALL', 'B', 'C', 'D', 'E']
+    regions.reset()
+
+
+def test_regions_bulk_update_saves_on_error(fake_exp):
+    regions = Regions(fake_exp)
+    regions.reset()
+    with pytest.raises(RuntimeError):
+        with regions.bulk_update():
+            regions.add(name='early', tmin=0, tmax=10)
+            raise RuntimeError('interrupted block')
+    assert Regions(fake_exp).get('early').tmax == 10
+    # saving is not deferred anymore
+    regions.add(name='late', tmin=0, tmax=30)
+    assert Regions(fake_exp).get('late').tmax == 30
+    regions.reset()
+
+
+def test_regions_name_reuse(fake_exp):
+    regions = Regions(fake_exp)
+    regions.reset()
+    assert regions.add(tmin=0, tmax=10) == 'A'
+    assert regions.add(tmin=0, tmax=20) == 'B'
+    regions.delete('A')
+    assert regions.add(tmin=0, tmax=30) == 'A'  # freed name is reused
+    # names in use are read from file by a new instance
+    reloaded = Regions(fake_exp)
+    assert reloaded.add(tmin=0, tmax=40) == 'C'
+    reloaded.delete('B')
+    assert Regions(fake_exp).add(tmin=0, tmax=50) == 'B'
+    regions.reset()
@@ -96,6 +96,22 @@ def test_observable_repr(all_params):
             assert getattr(nobs, attr) == getattr(obs, attr)
 
 
+def test_observable_cached_strings_reset():
+    """label, repr and _key are cached, and reset when a parameter is set"""
+    obs = Observable(name='length', raw='length')
+    label, rep, key = obs.label, repr(obs), obs._key
+    assert obs.label is label  # cached
+    obs.scale = 'log'
+    assert obs.label != label
+    assert repr(obs) != rep
+    assert obs._key != key
+    assert obs._key == Observable(name='length', raw='length',
+                                  scale='log')._key
+    obs.mode = 'birth'
+    assert obs.label == 'TtMbirthJ3_log_length'
+    assert obs.as_timelapse() is not obs
+
+
 def test_unrolling():
     length = Observable(name='length')
     width = Observable(name='width')